@@ -0,0 +1,62 @@
+"""create exports table
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'exports',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('export_type', sa.Enum('TRANSCRIPT', 'MATTER_SUMMARY', 'USER_REPORT', 'USAGE_REPORT', name='exporttype'), nullable=False),
+        sa.Column('format', sa.Enum('PDF', 'DOCX', 'TXT', 'JSON', 'CSV', 'XLSX', name='exportformat'), nullable=False),
+        sa.Column('resource_id', sa.String(length=255), nullable=False),
+        sa.Column('options', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('status', sa.Enum('PENDING', 'PROCESSING', 'COMPLETED', 'FAILED', name='exportstatus'), nullable=False),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('filename', sa.String(length=500), nullable=False),
+        sa.Column('file_size', sa.Integer(), nullable=True),
+        sa.Column('storage_path', sa.String(length=1000), nullable=True),
+        sa.PrimaryKeyConstraint('id', name=op.f('pk_exports')),
+    )
+    op.create_index(op.f('ix_exports_id'), 'exports', ['id'], unique=False)
+    op.create_index(op.f('ix_exports_created_at'), 'exports', ['created_at'], unique=False)
+    op.create_index(op.f('ix_exports_tenant_id'), 'exports', ['tenant_id'], unique=False)
+    op.create_index(
+        'ix_exports_tenant_status_type_created',
+        'exports',
+        ['tenant_id', 'status', 'export_type', sa.text('created_at DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_exports_tenant_status_type_created', table_name='exports')
+    op.drop_index(op.f('ix_exports_tenant_id'), table_name='exports')
+    op.drop_index(op.f('ix_exports_created_at'), table_name='exports')
+    op.drop_index(op.f('ix_exports_id'), table_name='exports')
+    op.drop_table('exports')
+    sa.Enum(name='exportstatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='exportformat').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='exporttype').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,57 @@
+"""add matter list indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_matters_tenant_updated',
+            'matters',
+            ['tenant_id', sa.text('updated_at DESC')],
+            unique=False,
+            postgresql_include=['status', 'priority', 'practice_area', 'title'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_matters_search',
+            'matters',
+            [sa.text(
+                "(title || ' ' || coalesce(description, '') || ' ' || "
+                "coalesce(case_number, '') || ' ' || coalesce(client_name, '')) gin_trgm_ops"
+            )],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_matters_search',
+            table_name='matters',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_matters_tenant_updated',
+            table_name='matters',
+            postgresql_concurrently=True,
+        )
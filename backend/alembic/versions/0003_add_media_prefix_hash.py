@@ -0,0 +1,33 @@
+"""add media asset prefix hash
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('media_assets', sa.Column('prefix_hash', sa.String(length=32), nullable=True))
+    op.create_index(
+        'ix_media_assets_tenant_size_prefix',
+        'media_assets',
+        ['tenant_id', 'file_size', 'prefix_hash'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_media_assets_tenant_size_prefix', table_name='media_assets')
+    op.drop_column('media_assets', 'prefix_hash')
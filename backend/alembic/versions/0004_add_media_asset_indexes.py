@@ -0,0 +1,51 @@
+"""add media asset tenant indexes
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_media_assets_tenant_content_hash',
+            'media_assets',
+            ['tenant_id', 'content_hash'],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_media_assets_tenant_updated',
+            'media_assets',
+            ['tenant_id', sa.text('updated_at DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_media_assets_tenant_updated',
+            table_name='media_assets',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_media_assets_tenant_content_hash',
+            table_name='media_assets',
+            postgresql_concurrently=True,
+        )
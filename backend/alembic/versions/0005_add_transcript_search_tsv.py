@@ -0,0 +1,47 @@
+"""add transcript full-text search column
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'transcripts',
+        sa.Column(
+            'search_tsv',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('simple', coalesce(title, '') || ' ' || "
+                "coalesce(content, '') || ' ' || coalesce(notes, ''))",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        'ix_transcripts_search_tsv',
+        'transcripts',
+        ['search_tsv'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transcripts_search_tsv', table_name='transcripts')
+    op.drop_column('transcripts', 'search_tsv')
@@ -0,0 +1,55 @@
+"""add transcript trigram indexes
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_transcripts_title_trgm',
+            'transcripts',
+            ['title'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'title': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_transcripts_notes_trgm',
+            'transcripts',
+            ['notes'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'notes': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_transcripts_notes_trgm',
+            table_name='transcripts',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_transcripts_title_trgm',
+            table_name='transcripts',
+            postgresql_concurrently=True,
+        )
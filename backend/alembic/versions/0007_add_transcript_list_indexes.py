@@ -0,0 +1,63 @@
+"""add transcript list indexes
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_transcripts_tenant_updated',
+            'transcripts',
+            ['tenant_id', sa.text('updated_at DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_transcripts_tenant_matter_updated',
+            'transcripts',
+            ['tenant_id', 'matter_id', sa.text('updated_at DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_transcripts_tenant_status_updated',
+            'transcripts',
+            ['tenant_id', 'status', sa.text('updated_at DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_transcripts_tenant_status_updated',
+            table_name='transcripts',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_transcripts_tenant_matter_updated',
+            table_name='transcripts',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_transcripts_tenant_updated',
+            table_name='transcripts',
+            postgresql_concurrently=True,
+        )
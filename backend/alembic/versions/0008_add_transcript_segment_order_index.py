@@ -0,0 +1,39 @@
+"""add transcript segment order index
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-16 15:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: Union[str, None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_transcript_segments_transcript_index',
+            'transcript_segments',
+            ['transcript_id', 'segment_index'],
+            unique=False,
+            postgresql_include=['start_time', 'end_time', 'speaker_id'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_transcript_segments_transcript_index',
+            table_name='transcript_segments',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,39 @@
+"""add transcript title prefix index
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009'
+down_revision: Union[str, None] = '0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_transcripts_title_lower_prefix',
+            'transcripts',
+            [sa.text('lower(title) text_pattern_ops')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_transcripts_title_lower_prefix',
+            table_name='transcripts',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,66 @@
+"""add transcript segment display columns
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-16 16:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0010'
+down_revision: Union[str, None] = '0009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _mmss_sql(column: str) -> str:
+    return (
+        f"CASE WHEN {column} < 600000 THEN '0' ELSE '' END || ({column} / 60000)::text"
+        f" || ':' || lpad((({column} / 1000) % 60)::text, 2, '0')"
+    )
+
+
+def upgrade() -> None:
+    op.add_column(
+        'transcript_segments',
+        sa.Column(
+            'start_time_formatted',
+            sa.Text(),
+            sa.Computed(_mmss_sql('start_time'), persisted=True),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        'transcript_segments',
+        sa.Column(
+            'end_time_formatted',
+            sa.Text(),
+            sa.Computed(_mmss_sql('end_time'), persisted=True),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        'transcript_segments',
+        sa.Column(
+            'display_speaker',
+            sa.Text(),
+            sa.Computed(
+                "coalesce(nullif(speaker_name, ''), "
+                "replace(nullif(speaker_id, ''), 'SPEAKER_', 'Speaker '), "
+                "'Unknown Speaker')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('transcript_segments', 'display_speaker')
+    op.drop_column('transcript_segments', 'end_time_formatted')
+    op.drop_column('transcript_segments', 'start_time_formatted')
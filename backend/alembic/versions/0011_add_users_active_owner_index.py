@@ -0,0 +1,40 @@
+"""add users active owner index
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0011'
+down_revision: Union[str, None] = '0010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_tenant_active_owner',
+            'users',
+            ['tenant_id'],
+            unique=False,
+            postgresql_where=sa.text("role = 'OWNER' AND is_active"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_users_tenant_active_owner',
+            table_name='users',
+            postgresql_concurrently=True,
+        )
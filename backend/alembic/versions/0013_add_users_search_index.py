@@ -0,0 +1,44 @@
+"""add users search index
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0013'
+down_revision: Union[str, None] = '0012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_search',
+            'users',
+            [sa.text(
+                "(email || ' ' || coalesce(first_name, '') || ' ' || "
+                "coalesce(last_name, '') || ' ' || coalesce(display_name, '')) gin_trgm_ops"
+            )],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_users_search',
+            table_name='users',
+            postgresql_concurrently=True,
+        )
@@ -37,7 +37,7 @@ async def register_user(
     """
     try:
         user = await auth_service.register_user(db, user_data)
-        return UserResponse.from_orm(user)
+        return UserResponse.model_validate(user)
     except ValidationError as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -91,18 +91,19 @@ async def get_current_user(
     """
     Get current user information.
     """
-    return UserResponse.from_orm(current_user)
+    return UserResponse.model_validate(current_user)
 
 
 @router.post("/logout")
 async def logout_user(
+    token: str = Depends(oauth2_scheme),
     current_user = Depends(auth_service.get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Logout user and invalidate tokens.
     """
-    await auth_service.logout_user(db, current_user.id)
+    await auth_service.logout_user(db, current_user.id, token)
     return {"message": "Successfully logged out"}
 
 
@@ -3,46 +3,38 @@ Export management endpoints for generating various output formats.
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, status, Query, Response
+from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_
-from pydantic import BaseModel, Field
+from sqlalchemy import select, insert, and_
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, field_validator
 from datetime import datetime
-from enum import Enum
+import asyncio
+import hashlib
 import uuid
 
+import orjson
+
 from app.core.database import get_db
+from app.models.export import Export, ExportFormat, ExportStatus, ExportType
+from app.models.matter import Matter
+from app.models.transcript import Transcript
 from app.models.user import User
 from app.services.auth_service import AuthService
+from app.services.storage_service import get_storage_service
+from app.tasks.celery_app import celery_app
 
 router = APIRouter()
 auth_service = AuthService()
 
-
-class ExportFormat(str, Enum):
-    """Export format options."""
-    PDF = "pdf"
-    DOCX = "docx"
-    TXT = "txt"
-    JSON = "json"
-    CSV = "csv"
-    XLSX = "xlsx"
-
-
-class ExportStatus(str, Enum):
-    """Export processing status."""
-    PENDING = "pending"
-    PROCESSING = "processing"
-    COMPLETED = "completed"
-    FAILED = "failed"
-
-
-class ExportType(str, Enum):
-    """Type of export."""
-    TRANSCRIPT = "transcript"
-    MATTER_SUMMARY = "matter_summary"
-    USER_REPORT = "user_report"
-    USAGE_REPORT = "usage_report"
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.PDF: "application/pdf",
+    ExportFormat.DOCX: "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ExportFormat.TXT: "text/plain; charset=utf-8",
+    ExportFormat.JSON: "application/json",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
 
 
 class ExportRequest(BaseModel):
@@ -56,9 +48,18 @@ class ExportRequest(BaseModel):
     date_format: str = Field("YYYY-MM-DD HH:mm:ss", description="Date format for timestamps")
     custom_template: Optional[str] = Field(None, description="Custom template ID for formatting")
 
+    @field_validator("resource_id")
+    @classmethod
+    def normalize_resource_id(cls, v):
+        """Canonicalize the UUID so it matches str(row.id) in title and worker lookups."""
+        try:
+            return str(uuid.UUID(v))
+        except ValueError:
+            raise ValueError("resource_id must be a UUID")
+
 
 class ExportResponse(BaseModel):
-    id: str
+    id: uuid.UUID
     export_type: ExportType
     format: ExportFormat
     status: ExportStatus
@@ -71,95 +72,132 @@ class ExportResponse(BaseModel):
     expires_at: Optional[datetime] = None
     error_message: Optional[str] = None
     
-    class Config:
-        from_attributes = True
-        use_enum_values = True
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
 
-# Mock export tracking (in production, this would be a database table)
-exports_db = {}
+export_list_adapter = TypeAdapter(List[ExportResponse])
 
 
-@router.post("/", response_model=ExportResponse, status_code=status.HTTP_201_CREATED)
-async def create_export(
-    export_request: ExportRequest,
-    current_user: User = Depends(auth_service.get_current_user),
-    db: AsyncSession = Depends(get_db)
-):
-    """Create a new export job."""
-    if not current_user.has_permission("export:create"):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Insufficient permissions to create exports"
-        )
-    
-    # Validate resource exists based on export type
-    if export_request.export_type == ExportType.TRANSCRIPT:
-        from app.models.transcript import Transcript
-        resource_query = select(Transcript).where(
+async def _build_export_rows(
+    export_requests: List[ExportRequest],
+    current_user: User,
+    db: AsyncSession
+) -> List[dict]:
+    """
+    Validate referenced resources and build export rows.
+
+    Resources are checked with one IN query per export type rather than
+    one query per request.
+    """
+    transcript_ids = {
+        r.resource_id for r in export_requests if r.export_type == ExportType.TRANSCRIPT
+    }
+    matter_ids = {
+        r.resource_id for r in export_requests if r.export_type == ExportType.MATTER_SUMMARY
+    }
+
+    transcript_titles = {}
+    if transcript_ids:
+        resource_query = select(Transcript.id, Transcript.title).where(
             and_(
-                Transcript.id == export_request.resource_id,
+                Transcript.id.in_(transcript_ids),
                 Transcript.tenant_id == current_user.tenant_id
             )
         )
         resource_result = await db.execute(resource_query)
-        resource = resource_result.scalar_one_or_none()
-        
-        if not resource:
+        transcript_titles = {str(row.id): row.title for row in resource_result}
+
+        missing = transcript_ids - transcript_titles.keys()
+        if missing:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail="Transcript not found"
+                detail=f"Transcript not found: {', '.join(sorted(missing))}"
             )
-        
-        filename = f"{resource.title}_{export_request.format.value}"
-        
-    elif export_request.export_type == ExportType.MATTER_SUMMARY:
-        from app.models.matter import Matter
-        resource_query = select(Matter).where(
+
+    matter_titles = {}
+    if matter_ids:
+        resource_query = select(Matter.id, Matter.title).where(
             and_(
-                Matter.id == export_request.resource_id,
+                Matter.id.in_(matter_ids),
                 Matter.tenant_id == current_user.tenant_id
             )
         )
         resource_result = await db.execute(resource_query)
-        resource = resource_result.scalar_one_or_none()
-        
-        if not resource:
+        matter_titles = {str(row.id): row.title for row in resource_result}
+
+        missing = matter_ids - matter_titles.keys()
+        if missing:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail="Matter not found"
+                detail=f"Matter not found: {', '.join(sorted(missing))}"
             )
-        
-        filename = f"matter_summary_{resource.title}_{export_request.format.value}"
-        
-    else:
-        # For user and usage reports, use tenant-level validation
-        filename = f"{export_request.export_type.value}_{export_request.format.value}"
-    
-    # Generate export ID
-    import uuid
-    export_id = str(uuid.uuid4())
+
+    rows = []
+    for export_request in export_requests:
+        if export_request.export_type == ExportType.TRANSCRIPT:
+            title = transcript_titles[export_request.resource_id]
+            filename = f"{title}_{export_request.format.value}"
+        elif export_request.export_type == ExportType.MATTER_SUMMARY:
+            title = matter_titles[export_request.resource_id]
+            filename = f"matter_summary_{title}_{export_request.format.value}"
+        else:
+            # For user and usage reports, use tenant-level validation
+            filename = f"{export_request.export_type.value}_{export_request.format.value}"
+
+        rows.append({
+            "tenant_id": current_user.tenant_id,
+            "user_id": current_user.id,
+            "export_type": export_request.export_type,
+            "format": export_request.format,
+            "status": ExportStatus.PENDING,
+            "resource_id": export_request.resource_id,
+            "filename": filename,
+            "options": export_request.model_dump(exclude={"export_type", "format", "resource_id"}),
+        })
+
+    return rows
+
+
+@router.post("/bulk", response_model=List[ExportResponse], status_code=status.HTTP_201_CREATED)
+async def create_exports_bulk(
+    export_requests: List[ExportRequest] = Body(..., min_length=1, max_length=100),
+    current_user: User = Depends(auth_service.get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Create several export jobs in one request."""
+    if not current_user.has_permission("export:create"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions to create exports"
+        )
     
-    # Create export record
-    export_record = {
-        "id": export_id,
-        "export_type": export_request.export_type,
-        "format": export_request.format,
-        "status": ExportStatus.PENDING,
-        "resource_id": export_request.resource_id,
-        "filename": filename,
-        "tenant_id": current_user.tenant_id,
-        "user_id": current_user.id,
-        "created_at": datetime.utcnow(),
-        "options": export_request.dict(exclude={"export_type", "format", "resource_id"})
-    }
+    rows = await _build_export_rows(export_requests, current_user, db)
     
-    exports_db[export_id] = export_record
+    # Single multi-row INSERT ... RETURNING for every export record
+    result = await db.scalars(insert(Export).values(rows).returning(Export))
+    exports = result.all()
+    await db.commit()
     
-    # TODO: Trigger background export task
-    # This would typically trigger a Celery task
+    # One task per request so the worker can batch resource loading; the
+    # broker publish blocks, so keep it off the event loop
+    await asyncio.to_thread(
+        celery_app.send_task,
+        "app.tasks.export_tasks.process_exports",
+        args=[[str(export.id) for export in exports]]
+    )
     
-    return ExportResponse(**export_record)
+    return export_list_adapter.validate_python(exports)
+
+
+@router.post("/", response_model=ExportResponse, status_code=status.HTTP_201_CREATED)
+async def create_export(
+    export_request: ExportRequest,
+    current_user: User = Depends(auth_service.get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Create a new export job."""
+    exports = await create_exports_bulk([export_request], current_user, db)
+    return exports[0]
 
 
 @router.get("/", response_model=List[ExportResponse])
@@ -178,22 +216,22 @@ async def list_exports(
             detail="Insufficient permissions to read exports"
         )
     
-    # Filter exports by tenant
-    tenant_exports = [
-        export for export in exports_db.values()
-        if export["tenant_id"] == current_user.tenant_id
-    ]
+    # Build query
+    query = select(Export).where(Export.tenant_id == current_user.tenant_id)
     
     # Apply filters
     if export_type:
-        tenant_exports = [e for e in tenant_exports if e["export_type"] == export_type]
+        query = query.where(Export.export_type == export_type)
     if status:
-        tenant_exports = [e for e in tenant_exports if e["status"] == status]
+        query = query.where(Export.status == status)
     
-    # Apply pagination
-    paginated_exports = tenant_exports[skip:skip + limit]
+    # Apply pagination and ordering
+    query = query.order_by(Export.created_at.desc()).offset(skip).limit(limit)
     
-    return [ExportResponse(**export) for export in paginated_exports]
+    result = await db.execute(query)
+    exports = result.scalars().all()
+    
+    return export_list_adapter.validate_python(exports)
 
 
 @router.get("/{export_id}", response_model=ExportResponse)
@@ -209,15 +247,22 @@ async def get_export(
             detail="Insufficient permissions to read exports"
         )
     
-    export_record = exports_db.get(export_id)
+    query = select(Export).where(
+        and_(
+            Export.id == export_id,
+            Export.tenant_id == current_user.tenant_id
+        )
+    )
+    result = await db.execute(query)
+    export = result.scalar_one_or_none()
     
-    if not export_record or export_record["tenant_id"] != current_user.tenant_id:
+    if not export:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Export not found"
         )
     
-    return ExportResponse(**export_record)
+    return ExportResponse.model_validate(export)
 
 
 @router.delete("/{export_id}")
@@ -233,16 +278,23 @@ async def delete_export(
             detail="Insufficient permissions to delete exports"
         )
     
-    export_record = exports_db.get(export_id)
+    query = select(Export).where(
+        and_(
+            Export.id == export_id,
+            Export.tenant_id == current_user.tenant_id
+        )
+    )
+    result = await db.execute(query)
+    export = result.scalar_one_or_none()
     
-    if not export_record or export_record["tenant_id"] != current_user.tenant_id:
+    if not export:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Export not found"
         )
     
     # Don't allow deletion of processing exports
-    if export_record["status"] == ExportStatus.PROCESSING:
+    if export.status == ExportStatus.PROCESSING:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot delete export that is currently processing"
@@ -250,7 +302,8 @@ async def delete_export(
     
     # TODO: Delete actual export file if it exists
     
-    del exports_db[export_id]
+    await db.delete(export)
+    await db.commit()
     
     return {"message": "Export deleted successfully"}
 
@@ -268,28 +321,41 @@ async def download_export(
             detail="Insufficient permissions to download exports"
         )
     
-    export_record = exports_db.get(export_id)
+    query = select(Export).where(
+        and_(
+            Export.id == export_id,
+            Export.tenant_id == current_user.tenant_id
+        )
+    )
+    result = await db.execute(query)
+    export = result.scalar_one_or_none()
     
-    if not export_record or export_record["tenant_id"] != current_user.tenant_id:
+    if not export:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Export not found"
         )
     
-    if export_record["status"] != ExportStatus.COMPLETED:
+    if not export.is_ready:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Export is not ready for download"
         )
     
-    # TODO: Implement actual file streaming/download
-    # This would typically return a FileResponse or generate a signed URL
+    storage_service = get_storage_service()
+    file_path = storage_service.storage_root / export.storage_path if export.storage_path else None
+    if file_path is None or not file_path.is_file():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Export file not found"
+        )
     
-    return {
-        "download_url": f"/files/exports/{export_id}/{export_record['filename']}",
-        "filename": export_record["filename"],
-        "expires_at": export_record.get("expires_at")
-    }
+    # FileResponse sets Content-Length/Content-Disposition and uses sendfile when available
+    return FileResponse(
+        file_path,
+        media_type=EXPORT_MEDIA_TYPES.get(export.format, "application/octet-stream"),
+        filename=export.filename
+    )
 
 
 @router.post("/templates", status_code=status.HTTP_201_CREATED)
@@ -321,12 +387,8 @@ async def create_export_template(
     }
 
 
-@router.get("/formats/supported")
-async def get_supported_formats(
-    export_type: Optional[ExportType] = None
-):
-    """Get supported export formats, optionally filtered by export type."""
-    
+def _build_supported_formats_payloads():
+    """Precompute the /formats/supported bodies; they only change on deploy."""
     format_support = {
         ExportType.TRANSCRIPT: [ExportFormat.PDF, ExportFormat.DOCX, ExportFormat.TXT, ExportFormat.JSON],
         ExportType.MATTER_SUMMARY: [ExportFormat.PDF, ExportFormat.DOCX, ExportFormat.JSON],
@@ -334,16 +396,44 @@ async def get_supported_formats(
         ExportType.USAGE_REPORT: [ExportFormat.PDF, ExportFormat.CSV, ExportFormat.XLSX, ExportFormat.JSON]
     }
     
-    if export_type:
-        return {
-            "export_type": export_type,
+    per_type = {
+        export_type: orjson.dumps({
+            "export_type": export_type.value,
             "supported_formats": [fmt.value for fmt in format_support.get(export_type, [])]
-        }
-    
-    return {
+        })
+        for export_type in ExportType
+    }
+    all_formats = orjson.dumps({
         "all_formats": [fmt.value for fmt in ExportFormat],
         "format_support": {
             export_type.value: [fmt.value for fmt in formats]
             for export_type, formats in format_support.items()
         }
-    }
\ No newline at end of file
+    })
+    
+    etag = '"' + hashlib.sha256(all_formats + b"".join(per_type.values())).hexdigest()[:32] + '"'
+    return all_formats, per_type, etag
+
+
+_ALL_FORMATS_PAYLOAD, _PER_TYPE_PAYLOADS, _FORMATS_ETAG = _build_supported_formats_payloads()
+
+
+@router.get("/formats/supported")
+async def get_supported_formats(
+    export_type: Optional[ExportType] = None,
+    if_none_match: Optional[str] = Header(None)
+):
+    """Get supported export formats, optionally filtered by export type."""
+    headers = {
+        "ETag": _FORMATS_ETAG,
+        "Cache-Control": "public, max-age=86400"
+    }
+    
+    if if_none_match == _FORMATS_ETAG:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return Response(
+        _PER_TYPE_PAYLOADS[export_type] if export_type else _ALL_FORMATS_PAYLOAD,
+        media_type="application/json",
+        headers=headers
+    )
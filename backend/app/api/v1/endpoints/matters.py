@@ -3,23 +3,27 @@ Matter management endpoints for legal case organization.
 """
 
 from typing import List, Optional
+from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, delete, exists, func, case
 
 from app.core.database import get_db
 from app.core.exceptions import ValidationError, PermissionError
-from app.models.matter import Matter, MatterParticipant, MatterNote, MatterDocument, MatterStatus, MatterPriority
+from app.models.matter import Matter, MatterParticipant, MatterNote, MatterDocument, MatterStatus, MatterPriority, matter_search_text
+from app.models.media import MediaAsset
+from app.models.transcript import Transcript, TranscriptSegment
 from app.models.user import User
 from app.services.auth_service import AuthService
+from app.services.storage_service import get_storage_service
 
 router = APIRouter()
 auth_service = AuthService()
 
 
 # Pydantic schemas for matter endpoints
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
 
 
@@ -63,7 +67,7 @@ class MatterUpdate(BaseModel):
 
 
 class MatterResponse(BaseModel):
-    id: str
+    id: UUID
     title: str
     description: Optional[str] = None
     case_number: Optional[str] = None
@@ -78,9 +82,26 @@ class MatterResponse(BaseModel):
     updated_at: datetime
     tags: List[str] = []
     
-    class Config:
-        from_attributes = True
-        use_enum_values = True
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
+
+
+# Columns projected by list_matters, matching MatterResponse
+MATTER_LIST_COLUMNS = (
+    Matter.id,
+    Matter.title,
+    Matter.description,
+    Matter.case_number,
+    Matter.client_name,
+    Matter.status,
+    Matter.priority,
+    Matter.practice_area,
+    Matter.total_transcripts,
+    Matter.total_duration_hours.label("total_duration_hours"),
+    Matter.total_storage_mb.label("total_storage_mb"),
+    Matter.created_at,
+    Matter.updated_at,
+    Matter.tags,
+)
 
 
 @router.get("/", response_model=List[MatterResponse])
@@ -101,8 +122,8 @@ async def list_matters(
             detail="Insufficient permissions to read matters"
         )
     
-    # Build query
-    query = select(Matter).where(Matter.tenant_id == current_user.tenant_id)
+    # Build query; read-only listing skips ORM hydration and response validation
+    query = select(*MATTER_LIST_COLUMNS).where(Matter.tenant_id == current_user.tenant_id)
     
     # Apply filters
     if status:
@@ -113,22 +134,14 @@ async def list_matters(
         query = query.where(Matter.practice_area == practice_area)
     if search:
         search_pattern = f"%{search}%"
-        query = query.where(
-            or_(
-                Matter.title.ilike(search_pattern),
-                Matter.description.ilike(search_pattern),
-                Matter.case_number.ilike(search_pattern),
-                Matter.client_name.ilike(search_pattern)
-            )
-        )
+        query = query.where(matter_search_text.ilike(search_pattern))
     
     # Apply pagination and ordering
     query = query.order_by(Matter.updated_at.desc()).offset(skip).limit(limit)
     
     result = await db.execute(query)
-    matters = result.scalars().all()
     
-    return [MatterResponse.from_orm(matter) for matter in matters]
+    return ORJSONResponse([dict(row) for row in result.mappings()])
 
 
 @router.post("/", response_model=MatterResponse, status_code=status.HTTP_201_CREATED)
@@ -154,14 +167,13 @@ async def create_matter(
     
     db.add(matter)
     await db.commit()
-    await db.refresh(matter)
     
-    return MatterResponse.from_orm(matter)
+    return MatterResponse.model_validate(matter)
 
 
 @router.get("/{matter_id}", response_model=MatterResponse)
 async def get_matter(
-    matter_id: str,
+    matter_id: UUID,
     current_user: User = Depends(auth_service.get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -172,32 +184,21 @@ async def get_matter(
             detail="Insufficient permissions to read matters"
         )
     
-    query = select(Matter).where(
-        and_(
-            Matter.id == matter_id,
-            Matter.tenant_id == current_user.tenant_id
-        )
-    ).options(
-        selectinload(Matter.matter_participants),
-        selectinload(Matter.media_assets),
-        selectinload(Matter.transcripts)
-    )
-    
-    result = await db.execute(query)
-    matter = result.scalar_one_or_none()
+    # MatterResponse only uses the denormalized totals, so no relationships are loaded
+    matter = await db.get(Matter, matter_id)
     
-    if not matter:
+    if matter is None or matter.tenant_id != current_user.tenant_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Matter not found"
         )
     
-    return MatterResponse.from_orm(matter)
+    return MatterResponse.model_validate(matter)
 
 
 @router.put("/{matter_id}", response_model=MatterResponse)
 async def update_matter(
-    matter_id: str,
+    matter_id: UUID,
     matter_data: MatterUpdate,
     current_user: User = Depends(auth_service.get_current_user),
     db: AsyncSession = Depends(get_db)
@@ -209,17 +210,10 @@ async def update_matter(
             detail="Insufficient permissions to update matters"
         )
     
-    # Get existing matter
-    query = select(Matter).where(
-        and_(
-            Matter.id == matter_id,
-            Matter.tenant_id == current_user.tenant_id
-        )
-    )
-    result = await db.execute(query)
-    matter = result.scalar_one_or_none()
+    # Get existing matter (identity map first, then a PK lookup)
+    matter = await db.get(Matter, matter_id)
     
-    if not matter:
+    if matter is None or matter.tenant_id != current_user.tenant_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Matter not found"
@@ -233,14 +227,13 @@ async def update_matter(
     matter.updated_by_user_id = current_user.id
     
     await db.commit()
-    await db.refresh(matter)
     
-    return MatterResponse.from_orm(matter)
+    return MatterResponse.model_validate(matter)
 
 
 @router.delete("/{matter_id}")
 async def delete_matter(
-    matter_id: str,
+    matter_id: UUID,
     current_user: User = Depends(auth_service.get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -251,38 +244,64 @@ async def delete_matter(
             detail="Insufficient permissions to delete matters"
         )
     
-    # Get existing matter
-    query = select(Matter).where(
-        and_(
-            Matter.id == matter_id,
-            Matter.tenant_id == current_user.tenant_id
-        )
-    )
-    result = await db.execute(query)
-    matter = result.scalar_one_or_none()
-    
-    if not matter:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Matter not found"
+    # Check and delete in one statement so a transcript added in between can't be lost
+    delete_query = delete(Matter).where(
+        Matter.id == matter_id,
+        Matter.tenant_id == current_user.tenant_id,
+        Matter.total_transcripts == 0
+    ).returning(Matter.id)
+    
+    result = await db.execute(delete_query)
+    
+    if result.first() is None:
+        # Nothing deleted: work out why (failure path only)
+        exists_query = select(
+            exists().where(
+                Matter.id == matter_id,
+                Matter.tenant_id == current_user.tenant_id
+            )
         )
-    
-    # Check if matter has associated data
-    if matter.total_transcripts > 0:
+        if not await db.scalar(exists_query):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Matter not found"
+            )
+        
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot delete matter with associated transcripts. Archive it instead."
         )
     
-    await db.delete(matter)
+    # A Core DELETE skips the ORM cascade on Matter's relationships and the
+    # schema has no ON DELETE CASCADE, so remove the children here, in the
+    # same transaction
+    matter_transcripts = select(Transcript.id).where(Transcript.matter_id == matter_id)
+    await db.execute(
+        delete(TranscriptSegment).where(TranscriptSegment.transcript_id.in_(matter_transcripts))
+    )
+    await db.execute(delete(Transcript).where(Transcript.matter_id == matter_id))
+    media_result = await db.execute(
+        delete(MediaAsset).where(MediaAsset.matter_id == matter_id).returning(MediaAsset.storage_path)
+    )
+    storage_paths = [path for path in media_result.scalars() if path]
+    await db.execute(delete(MatterParticipant).where(MatterParticipant.matter_id == matter_id))
+    
     await db.commit()
     
+    # Files go only once the rows are gone for good
+    storage_service = get_storage_service()
+    for storage_path in storage_paths:
+        if getattr(storage_service, "s3_client", None) is not None:
+            await storage_service.delete_object(storage_path)
+        else:
+            await storage_service.delete_file(storage_path)
+    
     return {"message": "Matter deleted successfully"}
 
 
 @router.post("/{matter_id}/archive")
 async def archive_matter(
-    matter_id: str,
+    matter_id: UUID,
     current_user: User = Depends(auth_service.get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -293,17 +312,10 @@ async def archive_matter(
             detail="Insufficient permissions to archive matters"
         )
     
-    # Get existing matter
-    query = select(Matter).where(
-        and_(
-            Matter.id == matter_id,
-            Matter.tenant_id == current_user.tenant_id
-        )
-    )
-    result = await db.execute(query)
-    matter = result.scalar_one_or_none()
+    # Get existing matter (identity map first, then a PK lookup)
+    matter = await db.get(Matter, matter_id)
     
-    if not matter:
+    if matter is None or matter.tenant_id != current_user.tenant_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Matter not found"
@@ -329,27 +341,26 @@ async def get_matter_stats(
             detail="Insufficient permissions to read matter statistics"
         )
     
-    # Count matters by status
-    status_query = select(
-        Matter.status,
-        func.count(Matter.id).label("count")
-    ).where(
-        Matter.tenant_id == current_user.tenant_id
-    ).group_by(Matter.status)
-    
-    status_result = await db.execute(status_query)
-    status_counts = {row.status: row.count for row in status_result}
-    
-    # Get totals
-    totals_query = select(
+    # Totals and per-status counts in a single round trip
+    stats_query = select(
         func.count(Matter.id).label("total_matters"),
         func.sum(Matter.total_transcripts).label("total_transcripts"),
         func.sum(Matter.total_duration_ms).label("total_duration_ms"),
-        func.sum(Matter.total_storage_bytes).label("total_storage_bytes")
+        func.sum(Matter.total_storage_bytes).label("total_storage_bytes"),
+        *[
+            func.sum(case((Matter.status == matter_status, 1), else_=0)).label(matter_status.value)
+            for matter_status in MatterStatus
+        ]
     ).where(Matter.tenant_id == current_user.tenant_id)
     
-    totals_result = await db.execute(totals_query)
-    totals = totals_result.first()
+    stats_result = await db.execute(stats_query)
+    totals = stats_result.first()
+    
+    status_counts = {}
+    for matter_status in MatterStatus:
+        count = getattr(totals, matter_status.value) or 0
+        if count:
+            status_counts[matter_status] = count
     
     return {
         "status_counts": status_counts,
@@ -4,23 +4,51 @@ Media asset management endpoints for file uploads and processing.
 
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
+from fastapi.responses import FileResponse, ORJSONResponse, RedirectResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_
-from pydantic import BaseModel, Field
+from sqlalchemy import select, update, and_, or_, exists, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
+import asyncio
+import hashlib
+import os
+import uuid
+from pathlib import Path
 
+import aiofiles
+import magic
+
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.exceptions import FileSizeExceededError
+from app.core.loaders import RequestCache, get_or_404, get_request_cache
 from app.models.user import User
+from app.models.matter import Matter
 from app.models.media import MediaAsset, MediaStatus, MediaType
 from app.services.auth_service import AuthService
+from app.services.storage_service import get_storage_service, hash_file_probe, hash_fileobj
 
 router = APIRouter()
 auth_service = AuthService()
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+MIME_SNIFF_BYTES = 4096
+
+# Exact MIME types first, then top-level types
+MIME_TO_MEDIA_TYPE = {
+    "application/pdf": MediaType.DOCUMENT,
+    "text/plain": MediaType.DOCUMENT,
+    "application/msword": MediaType.DOCUMENT,
+    "audio": MediaType.AUDIO,
+    "video": MediaType.VIDEO,
+    "image": MediaType.IMAGE,
+}
+
 
 class MediaAssetResponse(BaseModel):
-    id: str
-    matter_id: str
+    id: uuid.UUID
+    matter_id: uuid.UUID
     original_filename: str
     file_type: MediaType
     mime_type: str
@@ -37,9 +65,55 @@ class MediaAssetResponse(BaseModel):
     updated_at: datetime
     tags: List[str] = []
     
-    class Config:
-        from_attributes = True
-        use_enum_values = True
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
+
+
+# Columns projected by list_media_assets; derived fields are filled in by
+# _media_list_row so the list endpoint never hydrates ORM objects
+MEDIA_LIST_COLUMNS = (
+    MediaAsset.id,
+    MediaAsset.matter_id,
+    MediaAsset.original_filename,
+    MediaAsset.file_type,
+    MediaAsset.mime_type,
+    MediaAsset.file_size,
+    MediaAsset.duration_ms,
+    MediaAsset.status,
+    MediaAsset.language,
+    MediaAsset.speaker_diarization,
+    MediaAsset.is_confidential,
+    MediaAsset.created_at,
+    MediaAsset.updated_at,
+    MediaAsset.tags,
+)
+
+_TRANSCRIBABLE_TYPES = frozenset((MediaType.AUDIO, MediaType.VIDEO))
+_PROCESSED_STATUSES = frozenset((MediaStatus.TRANSCRIBED, MediaStatus.FAILED))
+
+
+def _media_list_row(row) -> dict:
+    """Shape a projected media row like MediaAssetResponse."""
+    item = dict(row)
+    duration_ms = item.pop("duration_ms")
+    item["file_size_mb"] = item["file_size"] / (1024 * 1024)
+    item["duration_seconds"] = duration_ms / 1000 if duration_ms else 0
+    item["can_transcribe"] = item["file_type"] in _TRANSCRIBABLE_TYPES
+    item["is_processed"] = item["status"] in _PROCESSED_STATUSES
+    item["tags"] = item["tags"] or []
+    return item
+
+
+def _insert_media_asset(**values):
+    """
+    INSERT a media asset unless the tenant already has the same content.
+
+    The unique (tenant_id, content_hash) index turns the duplicate check and
+    the insert into one statement, so concurrent re-uploads lose cleanly;
+    RETURNING yields no row for a duplicate.
+    """
+    return pg_insert(MediaAsset).values(**values).on_conflict_do_nothing(
+        index_elements=[MediaAsset.tenant_id, MediaAsset.content_hash]
+    ).returning(MediaAsset.id)
 
 
 class MediaAssetUpdate(BaseModel):
@@ -77,7 +151,7 @@ async def list_media_assets(
         )
     
     # Build query
-    query = select(MediaAsset).where(MediaAsset.tenant_id == current_user.tenant_id)
+    query = select(*MEDIA_LIST_COLUMNS).where(MediaAsset.tenant_id == current_user.tenant_id)
     
     # Apply filters
     if matter_id:
@@ -94,9 +168,8 @@ async def list_media_assets(
     query = query.order_by(MediaAsset.updated_at.desc()).offset(skip).limit(limit)
     
     result = await db.execute(query)
-    media_assets = result.scalars().all()
     
-    return [MediaAssetResponse.from_orm(asset) for asset in media_assets]
+    return ORJSONResponse([_media_list_row(row) for row in result.mappings()])
 
 
 @router.post("/upload", response_model=MediaAssetResponse, status_code=status.HTTP_201_CREATED)
@@ -116,108 +189,173 @@ async def upload_media_file(
             detail="Insufficient permissions to upload media files"
         )
     
-    # Verify matter exists and belongs to user's tenant
-    from app.models.matter import Matter
-    matter_query = select(Matter).where(
-        and_(
-            Matter.id == matter_id,
-            Matter.tenant_id == current_user.tenant_id
-        )
-    )
-    matter_result = await db.execute(matter_query)
-    matter = matter_result.scalar_one_or_none()
-    
-    if not matter:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Matter not found"
-        )
+    # Classify from the file's own magic bytes; the client's Content-Type is untrusted
+    head = await file.read(MIME_SNIFF_BYTES)
+    await file.seek(0)
+    mime_type = magic.from_buffer(head, mime=True)
+    media_type = MIME_TO_MEDIA_TYPE.get(mime_type) or MIME_TO_MEDIA_TYPE.get(mime_type.split("/", 1)[0])
     
-    # Validate file type
-    if not file.content_type:
+    if media_type is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="File content type is required"
+            detail="Unsupported file type"
         )
     
-    # Determine media type
-    if file.content_type.startswith("audio/"):
-        media_type = MediaType.AUDIO
-    elif file.content_type.startswith("video/"):
-        media_type = MediaType.VIDEO
-    elif file.content_type in ["application/pdf", "text/plain", "application/msword"]:
-        media_type = MediaType.DOCUMENT
-    elif file.content_type.startswith("image/"):
-        media_type = MediaType.IMAGE
-    else:
+    if file.size is not None and file.size > settings.MAX_UPLOAD_SIZE:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Unsupported file type"
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="File exceeds maximum upload size"
         )
     
-    # Read file content for hashing
-    file_content = await file.read()
-    file_size = len(file_content)
-    
-    # Generate content hash
-    import hashlib
-    content_hash = hashlib.sha256(file_content).hexdigest()
-    
-    # Check for duplicate files
-    duplicate_query = select(MediaAsset).where(
-        and_(
-            MediaAsset.tenant_id == current_user.tenant_id,
-            MediaAsset.content_hash == content_hash
+    # Verify the matter belongs to the user's tenant and probe head/tail/size
+    # for likely re-uploads in one round-trip, before anything hits disk
+    columns = [
+        exists().where(
+            and_(
+                Matter.id == matter_id,
+                Matter.tenant_id == current_user.tenant_id
+            )
+        ).label("matter_exists")
+    ]
+    prefix_hash = None
+    if file.size is not None:
+        prefix_hash = await asyncio.to_thread(hash_file_probe, file.file, file.size)
+        columns.append(
+            select(func.array_agg(MediaAsset.content_hash)).where(
+                and_(
+                    MediaAsset.tenant_id == current_user.tenant_id,
+                    MediaAsset.file_size == file.size,
+                    MediaAsset.prefix_hash == prefix_hash
+                )
+            ).scalar_subquery().label("candidate_hashes")
         )
-    )
-    duplicate_result = await db.execute(duplicate_query)
-    duplicate_asset = duplicate_result.scalar_one_or_none()
     
-    if duplicate_asset:
+    precheck = (await db.execute(select(*columns))).one()
+    
+    if not precheck.matter_exists:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="A file with identical content already exists"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Matter not found"
         )
     
-    # TODO: Implement actual file storage (local, S3, etc.)
-    # For now, we'll just simulate the storage path
-    storage_path = f"uploads/{current_user.tenant_id}/{matter_id}/{file.filename}"
-    
-    # Create media asset record
-    media_asset = MediaAsset(
-        tenant_id=current_user.tenant_id,
-        matter_id=matter_id,
-        original_filename=file.filename,
-        file_type=media_type,
-        mime_type=file.content_type,
-        file_size=file_size,
-        storage_path=storage_path,
-        content_hash=content_hash,
-        language=language,
-        speaker_diarization=speaker_diarization,
-        is_confidential=is_confidential,
-        status=MediaStatus.UPLOADED,
-        created_by_user_id=current_user.id,
-        updated_by_user_id=current_user.id
-    )
-    
-    db.add(media_asset)
-    await db.commit()
-    await db.refresh(media_asset)
+    if prefix_hash is not None and precheck.candidate_hashes:
+        if await asyncio.to_thread(hash_fileobj, file.file) in set(precheck.candidate_hashes):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="A file with identical content already exists"
+            )
+    
+    asset_values = {
+        "tenant_id": current_user.tenant_id,
+        "matter_id": matter_id,
+        "original_filename": file.filename,
+        "file_type": media_type,
+        "mime_type": mime_type,
+        "prefix_hash": prefix_hash,
+        "language": language,
+        "speaker_diarization": speaker_diarization,
+        "is_confidential": is_confidential,
+        "status": MediaStatus.UPLOADED,
+        "created_by": current_user.id,
+        "updated_by": current_user.id,
+    }
+    storage_service = get_storage_service()
+    # Client-supplied name: keep only the final component so it cannot
+    # climb out of the asset's directory
+    safe_filename = Path(file.filename).name
+    # Chosen up front so the storage path is unique to this asset
+    media_id = uuid.uuid4()
+    
+    if getattr(storage_service, "s3_client", None) is not None:
+        # Multipart straight into S3; the media ID in the key keeps a losing
+        # duplicate from overwriting another asset's object
+        storage_path = f"uploads/{current_user.tenant_id}/{matter_id}/{media_id}/{safe_filename}"
+        try:
+            file_size, content_hash = await storage_service.upload_stream(
+                file, storage_path, mime_type, safe_filename, settings.MAX_UPLOAD_SIZE
+            )
+        except FileSizeExceededError:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail="File exceeds maximum upload size"
+            )
+        
+        claimed = await db.execute(_insert_media_asset(
+            id=media_id,
+            file_size=file_size,
+            storage_path=storage_path,
+            content_hash=content_hash,
+            **asset_values
+        ))
+        
+        if claimed.scalar_one_or_none() is None:
+            await storage_service.delete_object(storage_path)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="A file with identical content already exists"
+            )
+        
+        await db.commit()
+    else:
+        # Stream to a temp file, hashing as we go, so memory stays at one chunk
+        temp_path = storage_service.storage_root / "temp" / uuid.uuid4().hex
+        hasher = hashlib.sha256()
+        file_size = 0
+        
+        try:
+            async with aiofiles.open(temp_path, "wb") as out:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    file_size += len(chunk)
+                    if file_size > settings.MAX_UPLOAD_SIZE:
+                        raise HTTPException(
+                            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                            detail="File exceeds maximum upload size"
+                        )
+                    # OpenSSL releases the GIL, so hashing overlaps the event loop
+                    await asyncio.to_thread(hasher.update, chunk)
+                    await out.write(chunk)
+            
+            content_hash = hasher.hexdigest()
+            storage_path = f"uploads/{current_user.tenant_id}/{matter_id}/{media_id}/{safe_filename}"
+            
+            claimed = await db.execute(_insert_media_asset(
+                id=media_id,
+                file_size=file_size,
+                storage_path=storage_path,
+                content_hash=content_hash,
+                **asset_values
+            ))
+            
+            if claimed.scalar_one_or_none() is None:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="A file with identical content already exists"
+                )
+            
+            final_path = storage_service.storage_root / storage_path
+            final_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(temp_path, final_path)
+            await db.commit()
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+    
+    media_asset = await db.get(MediaAsset, media_id)
     
     # TODO: Trigger background transcription task for audio/video files
     if media_asset.can_transcribe:
         # This would typically trigger a Celery task
         pass
     
-    return MediaAssetResponse.from_orm(media_asset)
+    return MediaAssetResponse.model_validate(media_asset)
 
 
 @router.get("/{media_id}", response_model=MediaAssetResponse)
 async def get_media_asset(
     media_id: str,
     current_user: User = Depends(auth_service.get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    cache: RequestCache = Depends(get_request_cache)
 ):
     """Get a specific media asset by ID."""
     if not current_user.has_permission("transcript:read"):
@@ -226,23 +364,12 @@ async def get_media_asset(
             detail="Insufficient permissions to read media assets"
         )
     
-    query = select(MediaAsset).where(
-        and_(
-            MediaAsset.id == media_id,
-            MediaAsset.tenant_id == current_user.tenant_id
-        )
+    media_asset = await get_or_404(
+        db, MediaAsset, media_id, current_user.tenant_id,
+        cache=cache, detail="Media asset not found"
     )
     
-    result = await db.execute(query)
-    media_asset = result.scalar_one_or_none()
-    
-    if not media_asset:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Media asset not found"
-        )
-    
-    return MediaAssetResponse.from_orm(media_asset)
+    return MediaAssetResponse.model_validate(media_asset)
 
 
 @router.put("/{media_id}", response_model=MediaAssetResponse)
@@ -259,14 +386,25 @@ async def update_media_asset(
             detail="Insufficient permissions to update media assets"
         )
     
-    # Get existing media asset
-    query = select(MediaAsset).where(
+    # Null tags/custom_fields mean "leave as is"; other fields are set verbatim
+    update_data = {
+        field: value
+        for field, value in media_data.model_dump(exclude_unset=True).items()
+        if value is not None or field not in ("tags", "custom_fields")
+    }
+    
+    # One UPDATE ... RETURNING instead of load, flush and refresh
+    update_stmt = update(MediaAsset).where(
         and_(
             MediaAsset.id == media_id,
             MediaAsset.tenant_id == current_user.tenant_id
         )
-    )
-    result = await db.execute(query)
+    ).values(
+        **update_data,
+        updated_by=current_user.id
+    ).returning(MediaAsset)
+    
+    result = await db.execute(update_stmt)
     media_asset = result.scalar_one_or_none()
     
     if not media_asset:
@@ -275,22 +413,9 @@ async def update_media_asset(
             detail="Media asset not found"
         )
     
-    # Update fields
-    update_data = media_data.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        if field == "tags" and value is not None:
-            media_asset.tags = value
-        elif field == "custom_fields" and value is not None:
-            media_asset.custom_fields = value
-        elif hasattr(media_asset, field):
-            setattr(media_asset, field, value)
-    
-    media_asset.updated_by_user_id = current_user.id
-    
     await db.commit()
-    await db.refresh(media_asset)
     
-    return MediaAssetResponse.from_orm(media_asset)
+    return MediaAssetResponse.model_validate(media_asset)
 
 
 @router.post("/{media_id}/transcribe")
@@ -298,7 +423,8 @@ async def start_transcription(
     media_id: str,
     transcription_request: TranscriptionRequest,
     current_user: User = Depends(auth_service.get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    cache: RequestCache = Depends(get_request_cache)
 ):
     """Start transcription for a media asset."""
     if not current_user.has_permission("transcript:create"):
@@ -308,20 +434,10 @@ async def start_transcription(
         )
     
     # Get media asset
-    query = select(MediaAsset).where(
-        and_(
-            MediaAsset.id == media_id,
-            MediaAsset.tenant_id == current_user.tenant_id
-        )
+    media_asset = await get_or_404(
+        db, MediaAsset, media_id, current_user.tenant_id,
+        cache=cache, detail="Media asset not found"
     )
-    result = await db.execute(query)
-    media_asset = result.scalar_one_or_none()
-    
-    if not media_asset:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Media asset not found"
-        )
     
     if not media_asset.can_transcribe:
         raise HTTPException(
@@ -359,7 +475,8 @@ async def start_transcription(
 async def delete_media_asset(
     media_id: str,
     current_user: User = Depends(auth_service.get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    cache: RequestCache = Depends(get_request_cache)
 ):
     """Delete a media asset."""
     if not current_user.has_permission("transcript:delete"):
@@ -369,20 +486,10 @@ async def delete_media_asset(
         )
     
     # Get existing media asset
-    query = select(MediaAsset).where(
-        and_(
-            MediaAsset.id == media_id,
-            MediaAsset.tenant_id == current_user.tenant_id
-        )
+    media_asset = await get_or_404(
+        db, MediaAsset, media_id, current_user.tenant_id,
+        cache=cache, detail="Media asset not found"
     )
-    result = await db.execute(query)
-    media_asset = result.scalar_one_or_none()
-    
-    if not media_asset:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Media asset not found"
-        )
     
     # Check if media has associated transcripts
     if media_asset.transcripts:
@@ -403,7 +510,8 @@ async def delete_media_asset(
 async def download_media_file(
     media_id: str,
     current_user: User = Depends(auth_service.get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    cache: RequestCache = Depends(get_request_cache)
 ):
     """Download a media file."""
     if not current_user.has_permission("transcript:read"):
@@ -413,26 +521,31 @@ async def download_media_file(
         )
     
     # Get media asset
-    query = select(MediaAsset).where(
-        and_(
-            MediaAsset.id == media_id,
-            MediaAsset.tenant_id == current_user.tenant_id
-        )
+    media_asset = await get_or_404(
+        db, MediaAsset, media_id, current_user.tenant_id,
+        cache=cache, detail="Media asset not found"
     )
-    result = await db.execute(query)
-    media_asset = result.scalar_one_or_none()
     
-    if not media_asset:
+    storage_service = get_storage_service()
+    if getattr(storage_service, "s3_client", None) is not None:
+        return RedirectResponse(
+            storage_service.presigned_download_url(
+                media_asset.storage_path, media_asset.original_filename
+            ),
+            status_code=status.HTTP_307_TEMPORARY_REDIRECT
+        )
+    
+    file_path = storage_service.storage_root / media_asset.storage_path
+    if not file_path.is_file():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Media asset not found"
+            detail="Media file not found"
         )
     
-    # TODO: Implement actual file streaming/download
-    # This would typically return a FileResponse or generate a signed URL
-    
-    return {
-        "download_url": media_asset.get_storage_url(signed=True),
-        "filename": media_asset.original_filename,
-        "content_type": media_asset.mime_type
-    }
\ No newline at end of file
+    # FileResponse streams from disk (sendfile when available), never buffering
+    # the whole file in the worker
+    return FileResponse(
+        file_path,
+        media_type=media_asset.mime_type,
+        filename=media_asset.original_filename
+    )
@@ -2,22 +2,31 @@
 Tenant management endpoints.
 """
 
-from typing import Optional
+import re
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from pydantic import BaseModel, Field
+from sqlalchemy import select, update, func, literal
+from sqlalchemy.dialects.postgresql import JSONB
+from pydantic import BaseModel, Field, ConfigDict, field_validator
 
+from app.core import tenant_cache
 from app.core.database import get_db
+from app.core.loaders import RequestCache, get_or_404, get_request_cache
 from app.models.user import User, Tenant, SubscriptionPlan
+from app.models.matter import Matter
 from app.services.auth_service import AuthService
 
 router = APIRouter()
 auth_service = AuthService()
 
+HEX_COLOR_RE = re.compile(r"^#[0-9a-fA-F]{6}$")
+
 
 class TenantResponse(BaseModel):
-    id: str
+    id: UUID
     name: str
     slug: str
     plan: SubscriptionPlan
@@ -30,25 +39,31 @@ class TenantResponse(BaseModel):
     primary_color: Optional[str] = None
     secondary_color: Optional[str] = None
     custom_domain: Optional[str] = None
-    created_at: str
+    created_at: datetime
     is_trial: bool
     is_active: bool
     features: dict = {}
     settings: dict = {}
 
-    class Config:
-        from_attributes = True
-        use_enum_values = True
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
 
 class TenantUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=255)
     logo_url: Optional[str] = Field(None, max_length=500)
-    primary_color: Optional[str] = Field(None, pattern=r"^#[0-9a-fA-F]{6}$")
-    secondary_color: Optional[str] = Field(None, pattern=r"^#[0-9a-fA-F]{6}$")
+    primary_color: Optional[str] = None
+    secondary_color: Optional[str] = None
     custom_domain: Optional[str] = Field(None, max_length=255)
     settings: Optional[dict] = None
 
+    @field_validator("primary_color", "secondary_color")
+    @classmethod
+    def validate_hex_color(cls, v):
+        """Validate a #RRGGBB color against the shared compiled pattern."""
+        if v is not None and not HEX_COLOR_RE.match(v):
+            raise ValueError("Color must be a hex value like #1A2B3C")
+        return v
+
 
 class TenantSettings(BaseModel):
     data_retention_days: Optional[int] = Field(None, ge=0)
@@ -59,23 +74,29 @@ class TenantSettings(BaseModel):
     transcription_quality: Optional[str] = Field(None, pattern=r"^(standard|high|premium)$")
 
 
+class FeatureBatch(BaseModel):
+    enable: List[str] = []
+    disable: List[str] = []
+
+
+async def _get_tenant_payload(db: AsyncSession, tenant_id, cache: RequestCache) -> dict:
+    """Serialized tenant for read paths, served from Redis when warm."""
+    payload = await tenant_cache.get_tenant(str(tenant_id))
+    if payload is None:
+        tenant = await get_or_404(db, Tenant, tenant_id, cache=cache, detail="Tenant not found")
+        payload = TenantResponse.model_validate(tenant).model_dump(mode="json")
+        await tenant_cache.set_tenant(str(tenant_id), payload)
+    return payload
+
+
 @router.get("/me", response_model=TenantResponse)
 async def get_current_tenant(
     current_user: User = Depends(auth_service.get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    cache: RequestCache = Depends(get_request_cache)
 ):
     """Get current user's tenant information."""
-    query = select(Tenant).where(Tenant.id == current_user.tenant_id)
-    result = await db.execute(query)
-    tenant = result.scalar_one_or_none()
-
-    if not tenant:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Tenant not found"
-        )
-
-    return TenantResponse.from_orm(tenant)
+    return await _get_tenant_payload(db, current_user.tenant_id, cache)
 
 
 @router.put("/me", response_model=TenantResponse)
@@ -92,9 +113,22 @@ async def update_current_tenant(
             detail="Only tenant owners can update tenant information"
         )
 
-    # Get tenant
-    query = select(Tenant).where(Tenant.id == current_user.tenant_id)
-    result = await db.execute(query)
+    update_data = tenant_data.model_dump(exclude_unset=True)
+
+    # Merge settings in Postgres (jsonb ||) rather than loading and merging here
+    new_settings = update_data.pop("settings", None)
+    if new_settings is not None:
+        update_data["settings"] = Tenant.settings.op("||")(literal(new_settings, JSONB))
+
+    # One UPDATE ... RETURNING instead of load, flush and refresh
+    update_stmt = update(Tenant).where(
+        Tenant.id == current_user.tenant_id
+    ).values(
+        **update_data,
+        updated_at=func.now()
+    ).returning(Tenant)
+
+    result = await db.execute(update_stmt)
     tenant = result.scalar_one_or_none()
 
     if not tenant:
@@ -103,28 +137,18 @@ async def update_current_tenant(
             detail="Tenant not found"
         )
 
-    # Update fields
-    update_data = tenant_data.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        if hasattr(tenant, field):
-            setattr(tenant, field, value)
-        elif field == "settings" and value is not None:
-            # Merge settings
-            if tenant.settings is None:
-                tenant.settings = {}
-            tenant.settings.update(value)
-
     await db.commit()
-    await db.refresh(tenant)
+    await tenant_cache.invalidate(str(tenant.id))
 
-    return TenantResponse.from_orm(tenant)
+    return TenantResponse.model_validate(tenant)
 
 
 @router.put("/me/settings")
 async def update_tenant_settings(
     settings_data: TenantSettings,
     current_user: User = Depends(auth_service.get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    cache: RequestCache = Depends(get_request_cache)
 ):
     """Update tenant settings."""
     # Only owners and admins can update settings
@@ -135,18 +159,12 @@ async def update_tenant_settings(
         )
 
     # Get tenant
-    query = select(Tenant).where(Tenant.id == current_user.tenant_id)
-    result = await db.execute(query)
-    tenant = result.scalar_one_or_none()
-
-    if not tenant:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Tenant not found"
-        )
+    tenant = await get_or_404(
+        db, Tenant, current_user.tenant_id, cache=cache, detail="Tenant not found"
+    )
 
     # Update settings
-    settings_dict = settings_data.dict(exclude_unset=True)
+    settings_dict = settings_data.model_dump(exclude_unset=True)
 
     if tenant.settings is None:
         tenant.settings = {}
@@ -164,6 +182,7 @@ async def update_tenant_settings(
             tenant.allowed_ip_ranges = value
 
     await db.commit()
+    await tenant_cache.invalidate(str(tenant.id))
 
     return {"message": "Tenant settings updated successfully", "settings": tenant.settings}
 
@@ -171,61 +190,50 @@ async def update_tenant_settings(
 @router.get("/me/usage")
 async def get_tenant_usage(
     current_user: User = Depends(auth_service.get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    cache: RequestCache = Depends(get_request_cache)
 ):
     """Get current tenant's resource usage."""
-    # Get tenant
-    query = select(Tenant).where(Tenant.id == current_user.tenant_id)
-    result = await db.execute(query)
-    tenant = result.scalar_one_or_none()
+    tenant = await _get_tenant_payload(db, current_user.tenant_id, cache)
 
-    if not tenant:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Tenant not found"
-        )
-
-    # Count current users
-    from sqlalchemy import func
-    user_count_query = select(func.count(User.id)).where(
+    # Active users and matter totals in a single round-trip
+    active_users = select(func.count(User.id)).where(
         User.tenant_id == current_user.tenant_id,
         User.is_active == True
-    )
-    user_count_result = await db.execute(user_count_query)
-    current_users = user_count_result.scalar()
+    ).scalar_subquery()
 
-    # Get storage and transcription usage from matters
-    from app.models.matter import Matter
     usage_query = select(
+        active_users.label("current_users"),
         func.sum(Matter.total_storage_bytes).label("total_storage_bytes"),
         func.sum(Matter.total_duration_ms).label("total_duration_ms"),
         func.count(Matter.id).label("total_matters")
     ).where(Matter.tenant_id == current_user.tenant_id)
 
     usage_result = await db.execute(usage_query)
-    usage = usage_result.first()
+    usage = usage_result.one()
+    current_users = usage.current_users or 0
 
     total_storage_gb = (usage.total_storage_bytes or 0) / (1024 * 1024 * 1024)
     total_transcription_hours = (usage.total_duration_ms or 0) / (1000 * 60 * 60)
 
     return {
-        "plan": tenant.plan.value,
-        "subscription_status": tenant.subscription_status,
+        "plan": tenant["plan"],
+        "subscription_status": tenant["subscription_status"],
         "usage": {
             "users": {
                 "current": current_users,
-                "limit": tenant.max_users,
-                "percentage": (current_users / tenant.max_users * 100) if tenant.max_users > 0 else 0
+                "limit": tenant["max_users"],
+                "percentage": (current_users / tenant["max_users"] * 100) if tenant["max_users"] > 0 else 0
             },
             "storage": {
                 "current_gb": round(total_storage_gb, 2),
-                "limit_gb": tenant.max_storage_gb,
-                "percentage": (total_storage_gb / tenant.max_storage_gb * 100) if tenant.max_storage_gb > 0 else 0
+                "limit_gb": tenant["max_storage_gb"],
+                "percentage": (total_storage_gb / tenant["max_storage_gb"] * 100) if tenant["max_storage_gb"] > 0 else 0
             },
             "transcription": {
                 "current_hours": round(total_transcription_hours, 2),
-                "limit_hours": tenant.max_transcription_hours,
-                "percentage": (total_transcription_hours / tenant.max_transcription_hours * 100) if tenant.max_transcription_hours > 0 else 0
+                "limit_hours": tenant["max_transcription_hours"],
+                "percentage": (total_transcription_hours / tenant["max_transcription_hours"] * 100) if tenant["max_transcription_hours"] > 0 else 0
             }
         },
         "totals": {
@@ -236,44 +244,37 @@ async def get_tenant_usage(
     }
 
 
-@router.post("/me/features/{feature}/enable")
-async def enable_feature(
-    feature: str,
-    current_user: User = Depends(auth_service.get_current_user),
-    db: AsyncSession = Depends(get_db)
-):
-    """Enable a feature for the tenant."""
-    # Only owners can manage features
-    if current_user.role.value != "owner":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only tenant owners can manage features"
-        )
+async def _apply_feature_changes(db: AsyncSession, tenant_id, changes: dict) -> dict:
+    """Merge feature flags into the tenant in one UPDATE and return the result."""
+    update_stmt = update(Tenant).where(
+        Tenant.id == tenant_id
+    ).values(
+        features=Tenant.features.op("||")(literal(changes, JSONB)),
+        updated_at=func.now()
+    ).returning(Tenant.features)
 
-    # Get tenant
-    query = select(Tenant).where(Tenant.id == current_user.tenant_id)
-    result = await db.execute(query)
-    tenant = result.scalar_one_or_none()
+    result = await db.execute(update_stmt)
+    features = result.scalar_one_or_none()
 
-    if not tenant:
+    if features is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tenant not found"
         )
 
-    tenant.enable_feature(feature)
     await db.commit()
+    await tenant_cache.invalidate(str(tenant_id))
 
-    return {"message": f"Feature '{feature}' enabled successfully"}
+    return features
 
 
-@router.post("/me/features/{feature}/disable")
-async def disable_feature(
-    feature: str,
+@router.post("/me/features")
+async def update_features(
+    batch: FeatureBatch,
     current_user: User = Depends(auth_service.get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Disable a feature for the tenant."""
+    """Enable and disable several tenant features at once."""
     # Only owners can manage features
     if current_user.role.value != "owner":
         raise HTTPException(
@@ -281,18 +282,34 @@ async def disable_feature(
             detail="Only tenant owners can manage features"
         )
 
-    # Get tenant
-    query = select(Tenant).where(Tenant.id == current_user.tenant_id)
-    result = await db.execute(query)
-    tenant = result.scalar_one_or_none()
+    # Disables win if a feature appears in both lists
+    changes = dict.fromkeys(batch.enable, True)
+    changes.update(dict.fromkeys(batch.disable, False))
 
-    if not tenant:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Tenant not found"
-        )
+    features = await _apply_feature_changes(db, current_user.tenant_id, changes)
 
-    tenant.disable_feature(feature)
-    await db.commit()
+    return {"message": "Features updated successfully", "features": features}
+
+
+@router.post("/me/features/{feature}/enable")
+async def enable_feature(
+    feature: str,
+    current_user: User = Depends(auth_service.get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Enable a feature for the tenant."""
+    await update_features(FeatureBatch(enable=[feature]), current_user, db)
+
+    return {"message": f"Feature '{feature}' enabled successfully"}
+
+
+@router.post("/me/features/{feature}/disable")
+async def disable_feature(
+    feature: str,
+    current_user: User = Depends(auth_service.get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Disable a feature for the tenant."""
+    await update_features(FeatureBatch(disable=[feature]), current_user, db)
 
-    return {"message": f"Feature '{feature}' disabled successfully"}
\ No newline at end of file
+    return {"message": f"Feature '{feature}' disabled successfully"}
@@ -2,22 +2,32 @@
 Transcript management endpoints.
 """
 
+import asyncio
+import base64
 import logging
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, BackgroundTasks
+import uuid
+from datetime import datetime
+from typing import List, Optional, Tuple
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status, UploadFile, File, Form, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from pydantic import BaseModel, Field
+from sqlalchemy import select, update, exists, func, and_, or_, tuple_, lambda_stmt
+from sqlalchemy.orm import load_only
+from pydantic import BaseModel, Field, ConfigDict
 
-from app.core.database import get_db
+from app.core import status_cache
+from app.core.database import get_db, sessionmanager
+from app.core.loaders import RequestCache, get_or_404, get_request_cache
 from app.models.user import User
-from app.models.transcript import Transcript, TranscriptSegment, TranscriptStatus
+from app.models.transcript import Transcript, TranscriptSegment, TranscriptStatus, transcript_title_lower
 from app.models.matter import Matter
 from app.models.media import MediaAsset
 from app.services.auth_service import AuthService
-from app.services.transcription_service import TranscriptionService, TranscriptionConfig
+from app.services.transcription_service import TranscriptionService
 from app.services.export_service import ExportService
 from app.core.config import settings
+from app.tasks.celery_app import celery_app
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +36,10 @@ auth_service = AuthService()
 transcription_service = TranscriptionService()
 export_service = ExportService()
 
+TRIGRAM_MIN_SEARCH_LENGTH = 3
+PREFIX_SEARCH_SUFFIX = "*"
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 class TranscriptResponse(BaseModel):
     """Transcript response model."""
@@ -44,8 +58,68 @@ class TranscriptResponse(BaseModel):
     createdAt: str
     updatedAt: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Transcript plus its media duration, for read paths
+TRANSCRIPT_READ_COLUMNS = (Transcript, MediaAsset.duration_ms)
+
+# Only the columns _transcript_response reads; leaves the full text and
+# search document on the server
+TRANSCRIPT_READ_LOAD = load_only(
+    Transcript.id,
+    Transcript.matter_id,
+    Transcript.title,
+    Transcript.language,
+    Transcript.model_used,
+    Transcript.created_at,
+    Transcript.updated_at,
+)
+
+
+def _transcript_response(transcript: Transcript, duration_ms: Optional[int] = None) -> dict:
+    """
+    Build a TranscriptResponse-shaped payload for ORJSONResponse.
+
+    Values come straight from typed ORM columns; UUIDs and datetimes are
+    left as-is for orjson to encode natively. Fields the model does not
+    store fall back to the same defaults create_transcript writes.
+    """
+    return {
+        "id": transcript.id,
+        "matterId": transcript.matter_id,
+        "title": transcript.title,
+        "language": transcript.language,
+        "asrModel": transcript.model_used or "",
+        "diarizationModel": None,
+        "totalDurationMs": duration_ms or 0,
+        "version": 1,
+        "encrypted": False,
+        "segments": [],
+        "speakerMap": {},
+        "mediaUrl": None,
+        "createdAt": transcript.created_at,
+        "updatedAt": transcript.updated_at,
+    }
+
+
+def _encode_cursor(transcript: Transcript) -> str:
+    """Opaque seek cursor for the (updated_at, id) position of a row."""
+    raw = f"{transcript.updated_at.isoformat()}|{transcript.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """Decode a cursor from _encode_cursor, or raise 400."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        updated_at, transcript_id = raw.split("|", 1)
+        return datetime.fromisoformat(updated_at), uuid.UUID(transcript_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
 
 
 class TranscriptCreate(BaseModel):
@@ -65,6 +139,10 @@ class TranscriptUpdate(BaseModel):
     speakerMap: Optional[dict] = None
 
 
+# TranscriptUpdate fields that map onto Transcript columns
+TRANSCRIPT_UPDATABLE_FIELDS = frozenset({"title"})
+
+
 class ExportRequest(BaseModel):
     """Export request model."""
     format: str
@@ -85,269 +163,296 @@ class ClipRequest(BaseModel):
 @router.get("/", response_model=List[TranscriptResponse])
 async def list_transcripts(
     matter_id: Optional[str] = None,
-    status: Optional[str] = None,
-    limit: int = 100,
-    offset: int = 0,
+    transcript_status: Optional[str] = Query(None, alias="status"),
+    search: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
     current_user: User = Depends(auth_service.get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """List transcripts for the current user's tenant."""
-    try:
-        # Build query
-        query = select(Transcript).where(Transcript.tenant_id == current_user.tenant_id)
-
-        if matter_id:
-            query = query.where(Transcript.matter_id == matter_id)
-
-        if status:
-            query = query.where(Transcript.status == status)
+    """
+    List transcripts for the current user's tenant.
+
+    Listings are newest-updated first and paged with ``cursor``: pass back the
+    X-Next-Cursor header from the previous page. A ``search`` ending in ``*``
+    is a case-insensitive title prefix match and pages the same way; any
+    other search is ordered by relevance and paged with ``offset`` instead.
+    ``offset`` without a ``cursor`` is still honored on listings for older
+    clients, but is deprecated there: deep offsets scan every skipped row.
+    """
+    prefix = search[:-1].strip().lower() if search and search.endswith(PREFIX_SEARCH_SUFFIX) else None
+    ranked = bool(search) and prefix is None
+    if offset and cursor and not ranked:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use either cursor or offset, not both"
+        )
+    seek = _decode_cursor(cursor) if cursor and not ranked else None
+
+    # Build query; media duration comes along in the same SELECT rather
+    # than through a per-row lazy load of Transcript.media_asset
+    query = select(*TRANSCRIPT_READ_COLUMNS).outerjoin(
+        MediaAsset, MediaAsset.id == Transcript.media_asset_id
+    ).options(TRANSCRIPT_READ_LOAD).where(Transcript.tenant_id == current_user.tenant_id)
+
+    if matter_id:
+        query = query.where(Transcript.matter_id == matter_id)
+
+    if transcript_status:
+        query = query.where(Transcript.status == transcript_status)
+
+    if prefix:
+        # Left-anchored match on lower(title), served by its text_pattern_ops index
+        query = query.where(transcript_title_lower.startswith(prefix, autoescape=True))
+
+    if ranked:
+        # GIN-indexed full-text match over title/content/notes, best matches first
+        ts_query = func.plainto_tsquery("simple", search)
+        conditions = [Transcript.search_tsv.op("@@")(ts_query)]
+        # Partial words fall back to ILIKE on title/notes, served by the
+        # trigram indexes; shorter patterns have no trigrams to use
+        if len(search) >= TRIGRAM_MIN_SEARCH_LENGTH:
+            search_pattern = f"%{search}%"
+            conditions.append(Transcript.title.ilike(search_pattern))
+            conditions.append(Transcript.notes.ilike(search_pattern))
+        # id breaks rank ties so offset pages don't overlap or skip rows
+        query = query.where(or_(*conditions)).order_by(
+            func.ts_rank_cd(Transcript.search_tsv, ts_query).desc(),
+            Transcript.id
+        ).offset(offset)
+    else:
+        # Keyset pagination: one range scan on the (tenant_id, updated_at)
+        # index however deep the page, unlike OFFSET
+        if seek:
+            query = query.where(
+                tuple_(Transcript.updated_at, Transcript.id) < tuple_(*seek)
+            )
+        query = query.order_by(Transcript.updated_at.desc(), Transcript.id.desc())
+        if offset:
+            # Deprecated offset paging, kept for clients without cursor support
+            query = query.offset(offset)
 
-        query = query.offset(offset).limit(limit)
+    result = await db.execute(query.limit(limit))
+    rows = result.all()
 
-        result = await db.execute(query)
-        transcripts = result.scalars().all()
+    headers = {}
+    if not ranked and len(rows) == limit:
+        headers[NEXT_CURSOR_HEADER] = _encode_cursor(rows[-1][0])
 
-        return [TranscriptResponse.from_orm(t) for t in transcripts]
-
-    except Exception as e:
-        logger.error(f"Failed to list transcripts: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve transcripts"
-        )
+    # Returning a Response skips FastAPI's response_model pass and jsonable_encoder
+    return ORJSONResponse([
+        _transcript_response(transcript, duration_ms)
+        for transcript, duration_ms in rows
+    ], headers=headers)
 
 
 @router.get("/{transcript_id}", response_model=TranscriptResponse)
 async def get_transcript(
     transcript_id: str,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(auth_service.get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get a specific transcript by ID."""
-    try:
-        query = select(Transcript).where(
-            Transcript.id == transcript_id,
-            Transcript.tenant_id == current_user.tenant_id
+    query = select(*TRANSCRIPT_READ_COLUMNS).outerjoin(
+        MediaAsset, MediaAsset.id == Transcript.media_asset_id
+    ).options(TRANSCRIPT_READ_LOAD).where(
+        Transcript.id == transcript_id,
+        Transcript.tenant_id == current_user.tenant_id
+    )
+    result = await db.execute(query)
+    row = result.one_or_none()
+
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Transcript not found"
         )
-        result = await db.execute(query)
-        transcript = result.scalar_one_or_none()
 
-        if not transcript:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Transcript not found"
-            )
+    transcript, duration_ms = row
 
-        return TranscriptResponse.from_orm(transcript)
+    # Count the view after the response is sent; nothing here waits on it
+    background_tasks.add_task(_bump_view_count, transcript.id)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get transcript {transcript_id}: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve transcript"
-        )
+    return ORJSONResponse(_transcript_response(transcript, duration_ms))
 
 
-@router.post("/", response_model=TranscriptResponse)
+@router.post("/", response_model=None, responses={200: {"model": TranscriptResponse}})
 async def create_transcript(
     transcript_data: TranscriptCreate,
     current_user: User = Depends(auth_service.get_current_user),
     db: AsyncSession = Depends(get_db)
-):
+) -> ORJSONResponse:
     """Create a new transcript."""
-    try:
-        # Verify matter exists and user has access
-        matter_query = select(Matter).where(
-            Matter.id == transcript_data.matterId,
-            Matter.tenant_id == current_user.tenant_id
-        )
-        matter_result = await db.execute(matter_query)
-        matter = matter_result.scalar_one_or_none()
-
-        if not matter:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Matter not found"
-            )
+    # Verify matter exists and user has access
+    matter_exists = await db.scalar(select(exists().where(
+        Matter.id == transcript_data.matterId,
+        Matter.tenant_id == current_user.tenant_id
+    )))
 
-        # Create transcript record
-        transcript = Transcript(
-            tenant_id=current_user.tenant_id,
-            matter_id=transcript_data.matterId,
-            title=transcript_data.title,
-            language=transcript_data.language,
-            asr_model=settings.WHISPER_MODEL_SIZE,
-            diarization_model=settings.PYANNOTE_MODEL if transcript_data.enableDiarization else None,
-            total_duration_ms=0,
-            version=1,
-            encrypted=False,
-            segments=[],
-            speaker_map={}
+    if not matter_exists:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Matter not found"
         )
 
-        db.add(transcript)
-        await db.commit()
-        await db.refresh(transcript)
+    # Create transcript record
+    transcript = Transcript(
+        tenant_id=current_user.tenant_id,
+        matter_id=transcript_data.matterId,
+        title=transcript_data.title,
+        language=transcript_data.language,
+        asr_model=settings.WHISPER_MODEL_SIZE,
+        diarization_model=settings.PYANNOTE_MODEL if transcript_data.enableDiarization else None,
+        total_duration_ms=0,
+        version=1,
+        encrypted=False,
+        segments=[],
+        speaker_map={}
+    )
 
-        return TranscriptResponse.from_orm(transcript)
+    db.add(transcript)
+    await db.commit()
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to create transcript: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create transcript"
-        )
+    return ORJSONResponse(_transcript_response(transcript))
 
 
-@router.put("/{transcript_id}", response_model=TranscriptResponse)
+@router.put("/{transcript_id}", response_model=None, responses={200: {"model": TranscriptResponse}})
 async def update_transcript(
     transcript_id: str,
     transcript_data: TranscriptUpdate,
     current_user: User = Depends(auth_service.get_current_user),
     db: AsyncSession = Depends(get_db)
-):
+) -> ORJSONResponse:
     """Update a transcript."""
-    try:
-        # Get transcript
-        query = select(Transcript).where(
+    update_data = {
+        field: value
+        for field, value in transcript_data.model_dump(exclude_unset=True).items()
+        if field in TRANSCRIPT_UPDATABLE_FIELDS and value is not None
+    }
+
+    # One UPDATE ... RETURNING, with the media duration alongside,
+    # instead of load, flush and refresh
+    media_duration = select(MediaAsset.duration_ms).where(
+        MediaAsset.id == Transcript.media_asset_id
+    ).scalar_subquery()
+    update_stmt = update(Transcript).where(
+        and_(
             Transcript.id == transcript_id,
             Transcript.tenant_id == current_user.tenant_id
         )
-        result = await db.execute(query)
-        transcript = result.scalar_one_or_none()
+    ).values(
+        **update_data,
+        updated_by=current_user.id
+    ).returning(Transcript, media_duration)
 
-        if not transcript:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Transcript not found"
-            )
+    result = await db.execute(update_stmt)
+    row = result.one_or_none()
 
-        # Update fields
-        if transcript_data.title is not None:
-            transcript.title = transcript_data.title
-
-        if transcript_data.segments is not None:
-            transcript.segments = transcript_data.segments
-
-        if transcript_data.speakerMap is not None:
-            transcript.speaker_map = transcript_data.speakerMap
-
-        await db.commit()
-        await db.refresh(transcript)
-
-        return TranscriptResponse.from_orm(transcript)
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to update transcript {transcript_id}: {e}")
+    if not row:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update transcript"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Transcript not found"
         )
 
+    await db.commit()
+
+    transcript, duration_ms = row
+    return ORJSONResponse(_transcript_response(transcript, duration_ms))
+
 
 @router.delete("/{transcript_id}")
 async def delete_transcript(
     transcript_id: str,
     current_user: User = Depends(auth_service.get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    cache: RequestCache = Depends(get_request_cache)
 ):
     """Delete a transcript."""
-    try:
-        # Get transcript
-        query = select(Transcript).where(
-            Transcript.id == transcript_id,
-            Transcript.tenant_id == current_user.tenant_id
-        )
-        result = await db.execute(query)
-        transcript = result.scalar_one_or_none()
-
-        if not transcript:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Transcript not found"
-            )
+    # Get transcript
+    transcript = await get_or_404(
+        db, Transcript, transcript_id, current_user.tenant_id,
+        cache=cache, detail="Transcript not found"
+    )
 
-        # Delete transcript
-        await db.delete(transcript)
-        await db.commit()
+    # Delete transcript
+    await db.delete(transcript)
+    await db.commit()
 
-        return {"message": "Transcript deleted successfully"}
+    return {"message": "Transcript deleted successfully"}
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to delete transcript {transcript_id}: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete transcript"
-        )
 
-
-@router.post("/{transcript_id}/transcribe")
+@router.post("/{transcript_id}/transcribe", status_code=status.HTTP_202_ACCEPTED)
 async def start_transcription(
     transcript_id: str,
-    background_tasks: BackgroundTasks,
     current_user: User = Depends(auth_service.get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Start transcription for a transcript."""
-    try:
-        # Get transcript
-        query = select(Transcript).where(
-            Transcript.id == transcript_id,
-            Transcript.tenant_id == current_user.tenant_id
+    # Get transcript and its media in one round-trip
+    query = select(Transcript, MediaAsset).outerjoin(
+        MediaAsset,
+        and_(
+            MediaAsset.id == Transcript.media_asset_id,
+            MediaAsset.tenant_id == Transcript.tenant_id
         )
-        result = await db.execute(query)
-        transcript = result.scalar_one_or_none()
-
-        if not transcript:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Transcript not found"
-            )
-
-        # Get associated media
-        media_query = select(MediaAsset).where(
-            MediaAsset.matter_id == transcript.matter_id,
-            MediaAsset.tenant_id == current_user.tenant_id
+    ).where(
+        Transcript.id == transcript_id,
+        Transcript.tenant_id == current_user.tenant_id
+    )
+    result = await db.execute(query)
+    row = result.one_or_none()
+
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Transcript not found"
         )
-        media_result = await db.execute(media_query)
-        media = media_result.scalar_one_or_none()
-
-        if not media:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No media found for this transcript"
-            )
 
-        # Update transcript status
-        transcript.status = TranscriptStatus.PROCESSING
-        await db.commit()
+    transcript, media = row
 
-        # Start transcription in background
-        background_tasks.add_task(
-            _process_transcription,
-            transcript_id,
-            media.storage_uri,
-            current_user.tenant_id
+    if transcript.status == TranscriptStatus.PROCESSING:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Transcription is already in progress"
         )
 
-        return {"message": "Transcription started successfully"}
+    if not media:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No media found for this transcript"
+        )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to start transcription for {transcript_id}: {e}")
+    # Claim the transcript in one guarded UPDATE so two concurrent requests
+    # can't both queue a job
+    claimed = await db.scalar(
+        update(Transcript).where(
+            Transcript.id == transcript.id,
+            Transcript.status != TranscriptStatus.PROCESSING
+        ).values(status=TranscriptStatus.PROCESSING).returning(Transcript.id)
+    )
+    if claimed is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to start transcription"
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Transcription is already in progress"
         )
+    await db.commit()
+    await status_cache.invalidate(str(current_user.tenant_id), str(transcript.id))
+
+    # ASR runs on the Celery workers, not in this API process; the broker
+    # publish blocks, so keep it off the event loop
+    await asyncio.to_thread(
+        celery_app.send_task,
+        "app.tasks.transcription_tasks.transcribe_media",
+        args=[str(media.id), str(transcript.id)]
+    )
+
+    return {
+        "message": "Transcription queued",
+        "transcript_id": str(transcript.id),
+        "status_url": f"/api/v1/transcripts/{transcript.id}/status"
+    }
 
 
 @router.post("/{transcript_id}/export")
@@ -358,52 +463,42 @@ async def export_transcript(
     db: AsyncSession = Depends(get_db)
 ):
     """Export transcript in the specified format."""
-    try:
-        # Get transcript
-        query = select(Transcript).where(
-            Transcript.id == transcript_id,
-            Transcript.tenant_id == current_user.tenant_id
+    # Get transcript and its matter in one round-trip
+    query = select(Transcript, Matter).outerjoin(
+        Matter,
+        and_(
+            Matter.id == Transcript.matter_id,
+            Matter.tenant_id == Transcript.tenant_id
         )
-        result = await db.execute(query)
-        transcript = result.scalar_one_or_none()
-
-        if not transcript:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Transcript not found"
-            )
-
-        # Get associated matter
-        matter_query = select(Matter).where(
-            Matter.id == transcript.matter_id,
-            Matter.tenant_id == current_user.tenant_id
-        )
-        matter_result = await db.execute(matter_query)
-        matter = matter_result.scalar_one_or_none()
-
-        # Export transcript
-        export_path = await export_service.export_transcript(
-            transcript=transcript,
-            format=export_request.format,
-            options=export_request.options,
-            matter=matter
+    ).where(
+        Transcript.id == transcript_id,
+        Transcript.tenant_id == current_user.tenant_id
+    )
+    result = await db.execute(query)
+    row = result.one_or_none()
+
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Transcript not found"
         )
 
-        # In production, this would return a download URL
-        return {
-            "message": "Export completed successfully",
-            "format": export_request.format,
-            "file_path": export_path
-        }
+    transcript, matter = row
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to export transcript {transcript_id}: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to export transcript"
-        )
+    # Export transcript
+    export_path = await export_service.export_transcript(
+        transcript=transcript,
+        format=export_request.format,
+        options=export_request.options,
+        matter=matter
+    )
+
+    # In production, this would return a download URL
+    return {
+        "message": "Export completed successfully",
+        "format": export_request.format,
+        "file_path": export_path
+    }
 
 
 @router.post("/{transcript_id}/clips")
@@ -411,132 +506,113 @@ async def create_clip(
     transcript_id: str,
     clip_request: ClipRequest,
     current_user: User = Depends(auth_service.get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    cache: RequestCache = Depends(get_request_cache)
 ):
     """Create a clip from the transcript."""
-    try:
-        # Get transcript
-        query = select(Transcript).where(
-            Transcript.id == transcript_id,
-            Transcript.tenant_id == current_user.tenant_id
+    # Get transcript
+    transcript = await get_or_404(
+        db, Transcript, transcript_id, current_user.tenant_id,
+        cache=cache, detail="Transcript not found"
+    )
+
+    # Validate time range
+    if clip_request.startMs >= clip_request.endMs:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Start time must be before end time"
         )
-        result = await db.execute(query)
-        transcript = result.scalar_one_or_none()
-
-        if not transcript:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Transcript not found"
-            )
-
-        # Validate time range
-        if clip_request.startMs >= clip_request.endMs:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Start time must be before end time"
-            )
-
-        if clip_request.startMs < 0 or clip_request.endMs > transcript.totalDurationMs:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Time range out of bounds"
-            )
 
-        # Create clip
-        clip_path = await transcription_service.create_clip(
-            transcript=transcript,
-            start_ms=clip_request.startMs,
-            end_ms=clip_request.endMs,
-            include_video=clip_request.includeVideo,
-            include_audio=clip_request.includeAudio
+    if clip_request.startMs < 0 or clip_request.endMs > transcript.totalDurationMs:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Time range out of bounds"
         )
 
-        return {
-            "message": "Clip created successfully",
-            "clip_path": clip_path,
-            "start_ms": clip_request.startMs,
-            "end_ms": clip_request.endMs,
-            "duration_ms": clip_request.endMs - clip_request.startMs
-        }
+    # Create clip
+    clip_path = await transcription_service.create_clip(
+        transcript=transcript,
+        start_ms=clip_request.startMs,
+        end_ms=clip_request.endMs,
+        include_video=clip_request.includeVideo,
+        include_audio=clip_request.includeAudio
+    )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to create clip for {transcript_id}: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create clip"
-        )
+    return {
+        "message": "Clip created successfully",
+        "clip_path": clip_path,
+        "start_ms": clip_request.startMs,
+        "end_ms": clip_request.endMs,
+        "duration_ms": clip_request.endMs - clip_request.startMs
+    }
 
 
 @router.get("/{transcript_id}/status")
 async def get_transcript_status(
     transcript_id: str,
+    request: Request,
     current_user: User = Depends(auth_service.get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get the status of a transcript."""
-    try:
-        query = select(Transcript).where(
-            Transcript.id == transcript_id,
-            Transcript.tenant_id == current_user.tenant_id
-        )
-        result = await db.execute(query)
-        transcript = result.scalar_one_or_none()
-
-        if not transcript:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Transcript not found"
-            )
-
-        return {
-            "id": transcript.id,
-            "status": transcript.status,
-            "progress": getattr(transcript, 'progress', 0),
-            "error": getattr(transcript, 'error', None),
-            "created_at": transcript.created_at,
-            "updated_at": transcript.updated_at
-        }
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get status for {transcript_id}: {e}")
+    # Pollers hit this every second or two; serve the serialized body
+    # from Redis and answer unchanged polls with 304
+    body = await status_cache.get_status(str(current_user.tenant_id), transcript_id)
+    if body is None:
+        body = await _load_transcript_status(db, transcript_id, current_user.tenant_id)
+        await status_cache.set_status(str(current_user.tenant_id), transcript_id, body)
+
+    etag = status_cache.etag_for(body)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+async def _load_transcript_status(db: AsyncSession, transcript_id: str, tenant_id) -> str:
+    """Query a transcript's status and serialize it to JSON, or raise 404."""
+    # Status polling only needs a few narrow columns, not the full row
+    # with its content and search document. Clients poll this, so the
+    # statement is built once as a cached lambda and only rebound
+    query = lambda_stmt(lambda: select(
+        Transcript.id,
+        Transcript.status,
+        Transcript.processing_error,
+        Transcript.created_at,
+        Transcript.updated_at
+    ).where(
+        Transcript.id == transcript_id,
+        Transcript.tenant_id == tenant_id
+    ))
+    result = await db.execute(query)
+    transcript = result.one_or_none()
+
+    if not transcript:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to get transcript status"
-        )
-
-
-async def _process_transcription(
-    transcript_id: str,
-    media_path: str,
-    tenant_id: str
-):
-    """Background task to process transcription."""
-    try:
-        logger.info(f"Starting transcription for {transcript_id}")
-
-        # Configure transcription
-        config = TranscriptionConfig(
-            language="en",
-            model_size=settings.WHISPER_MODEL_SIZE,
-            compute_type=settings.WHISPER_COMPUTE_TYPE,
-            device=settings.WHISPER_DEVICE,
-            enable_diarization=settings.ENABLE_DIARIZATION,
-            enable_word_timing=True
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Transcript not found"
         )
 
-        # Run transcription
-        result = await transcription_service.transcribe_media(media_path, config)
+    return orjson.dumps({
+        "id": transcript.id,
+        "status": transcript.status,
+        "progress": 0,
+        "error": transcript.processing_error,
+        "created_at": transcript.created_at,
+        "updated_at": transcript.updated_at
+    }).decode()
 
-        # Update transcript in database
-        # This would require a database session, so we'd need to handle this differently
-        # For now, just log the result
-        logger.info(f"Transcription completed for {transcript_id}: {len(result.segments)} segments")
 
+async def _bump_view_count(transcript_id):
+    """Background task to count a transcript view in its own session."""
+    try:
+        async with sessionmanager.session() as db:
+            # Increment in SQL so concurrent readers don't lose counts
+            await db.execute(
+                update(Transcript).where(
+                    Transcript.id == transcript_id
+                ).values(view_count=Transcript.view_count + 1)
+            )
+            await db.commit()
     except Exception as e:
-        logger.error(f"Transcription failed for {transcript_id}: {e}")
-        # Update transcript status to failed
-        # This would also require database access
\ No newline at end of file
+        logger.warning(f"Failed to count view for {transcript_id}: {e}")
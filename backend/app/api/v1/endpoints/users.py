@@ -4,12 +4,16 @@ User management endpoints.
 
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func
-from pydantic import BaseModel, EmailStr, Field
+from sqlalchemy import select, update, exists, and_, or_
+from sqlalchemy.orm import aliased
+from pydantic import BaseModel, EmailStr, Field, ConfigDict
 
+from app.core import token_cache
 from app.core.database import get_db
-from app.models.user import User, UserRole
+from app.core.loaders import RequestCache, get_or_404, get_request_cache
+from app.models.user import User, UserRole, user_search_text
 from app.services.auth_service import AuthService
 
 router = APIRouter()
@@ -31,9 +35,64 @@ class UserResponse(BaseModel):
     last_login_at: Optional[str] = None
     created_at: str
     
-    class Config:
-        from_attributes = True
-        use_enum_values = True
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
+
+
+def _user_response(user: User) -> dict:
+    """
+    Build a UserResponse-shaped payload for ORJSONResponse.
+
+    UUIDs, datetimes and the role enum are left for orjson to encode natively.
+    """
+    return {
+        "id": user.id,
+        "email": user.email,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "display_name": user.display_name,
+        "avatar_url": user.avatar_url,
+        "role": user.role,
+        "is_active": user.is_active,
+        "is_verified": user.is_verified,
+        "full_name": user.full_name,
+        "initials": user.initials,
+        "last_login_at": user.last_login_at,
+        "created_at": user.created_at,
+    }
+
+
+def _other_active_owner_exists():
+    """Correlated EXISTS: the updated row's tenant has another active owner."""
+    other_owner = aliased(User)
+    return exists().where(
+        and_(
+            other_owner.tenant_id == User.tenant_id,
+            other_owner.role == UserRole.OWNER,
+            other_owner.is_active == True,
+            other_owner.id != User.id
+        )
+    )
+
+
+async def _lock_active_owners(db: AsyncSession, tenant_id) -> None:
+    """
+    Row-lock the tenant's active owners until commit.
+
+    Under READ COMMITTED, Postgres re-checks an UPDATE's WHERE only against
+    the locked target row, not inside a correlated EXISTS, so two concurrent
+    demotions of the last two owners could both pass the guard. Taking the
+    owner locks first serializes them; the later UPDATE then runs with a
+    fresh snapshot and sees the earlier change.
+    """
+    await db.execute(
+        select(User.id).where(
+            and_(
+                User.tenant_id == tenant_id,
+                User.role == UserRole.OWNER,
+                User.is_active == True
+            )
+        ).with_for_update()
+    )
 
 
 class UserUpdate(BaseModel):
@@ -47,6 +106,13 @@ class UserUpdate(BaseModel):
     preferences: Optional[dict] = None
 
 
+# UserUpdate fields users may change on their own profile; never their role
+_USER_PROFILE_FIELDS = frozenset({
+    "first_name", "last_name", "display_name", "avatar_url",
+    "timezone", "language", "preferences",
+})
+
+
 class UserInvite(BaseModel):
     email: EmailStr
     role: UserRole = UserRole.VIEWER
@@ -81,22 +147,15 @@ async def list_users(
         query = query.where(User.is_active == is_active)
     if search:
         search_pattern = f"%{search}%"
-        query = query.where(
-            or_(
-                User.email.ilike(search_pattern),
-                User.first_name.ilike(search_pattern),
-                User.last_name.ilike(search_pattern),
-                User.display_name.ilike(search_pattern)
-            )
-        )
+        query = query.where(user_search_text.ilike(search_pattern))
     
     # Apply pagination and ordering
     query = query.order_by(User.created_at.desc()).offset(skip).limit(limit)
     
     result = await db.execute(query)
-    users = result.scalars().all()
     
-    return [UserResponse.from_orm(user) for user in users]
+    # Returning a Response skips FastAPI's response_model pass and jsonable_encoder
+    return ORJSONResponse([_user_response(user) for user in result.scalars()])
 
 
 @router.get("/me", response_model=UserResponse)
@@ -104,36 +163,33 @@ async def get_current_user_profile(
     current_user: User = Depends(auth_service.get_current_user)
 ):
     """Get current user's profile."""
-    return UserResponse.from_orm(current_user)
+    return ORJSONResponse(_user_response(current_user))
 
 
-@router.put("/me", response_model=UserResponse)
+@router.put("/me", response_model=None, responses={200: {"model": UserResponse}})
 async def update_current_user_profile(
     user_data: UserUpdate,
     current_user: User = Depends(auth_service.get_current_user),
     db: AsyncSession = Depends(get_db)
-):
+) -> ORJSONResponse:
     """Update current user's profile."""
-    # Users can't change their own role
-    update_data = user_data.dict(exclude_unset=True, exclude={"role"})
+    update_data = user_data.model_dump(exclude_unset=True)
     
-    for field, value in update_data.items():
-        if hasattr(current_user, field):
-            setattr(current_user, field, value)
-        elif field == "preferences" and value is not None:
-            current_user.preferences = value
+    for field in _USER_PROFILE_FIELDS & update_data.keys():
+        setattr(current_user, field, update_data[field])
     
     await db.commit()
-    await db.refresh(current_user)
+    await token_cache.invalidate_user(str(current_user.id))
     
-    return UserResponse.from_orm(current_user)
+    return ORJSONResponse(_user_response(current_user))
 
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: str,
     current_user: User = Depends(auth_service.get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    cache: RequestCache = Depends(get_request_cache)
 ):
     """Get a specific user by ID."""
     if not current_user.has_permission("user:read"):
@@ -142,32 +198,21 @@ async def get_user(
             detail="Insufficient permissions to read users"
         )
     
-    query = select(User).where(
-        and_(
-            User.id == user_id,
-            User.tenant_id == current_user.tenant_id
-        )
+    user = await get_or_404(
+        db, User, user_id, current_user.tenant_id,
+        cache=cache, detail="User not found"
     )
     
-    result = await db.execute(query)
-    user = result.scalar_one_or_none()
-    
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-    
-    return UserResponse.from_orm(user)
+    return ORJSONResponse(_user_response(user))
 
 
-@router.put("/{user_id}", response_model=UserResponse)
+@router.put("/{user_id}", response_model=None, responses={200: {"model": UserResponse}})
 async def update_user(
     user_id: str,
     user_data: UserUpdate,
     current_user: User = Depends(auth_service.get_current_user),
     db: AsyncSession = Depends(get_db)
-):
+) -> ORJSONResponse:
     """Update a user."""
     if not current_user.has_permission("user:update"):
         raise HTTPException(
@@ -175,65 +220,63 @@ async def update_user(
             detail="Insufficient permissions to update users"
         )
     
-    # Get existing user
-    query = select(User).where(
-        and_(
-            User.id == user_id,
-            User.tenant_id == current_user.tenant_id
-        )
-    )
-    result = await db.execute(query)
+    # Columns to write; None only where the column allows it
+    update_data = {
+        field: value
+        for field, value in user_data.model_dump(exclude_unset=True).items()
+        if value is not None or User.__table__.c[field].nullable
+    }
+    
+    conditions = [
+        User.id == user_id,
+        User.tenant_id == current_user.tenant_id
+    ]
+    new_role = update_data.get("role")
+    if new_role is not None:
+        # Only owners can change user roles
+        if current_user.role != UserRole.OWNER:
+            conditions.append(User.role == new_role)
+        # Never demote the last active owner
+        if new_role != UserRole.OWNER:
+            await _lock_active_owners(db, current_user.tenant_id)
+            conditions.append(or_(
+                User.role != UserRole.OWNER,
+                _other_active_owner_exists()
+            ))
+    
+    # The role guards ride on the UPDATE itself rather than a separate
+    # load-then-check
+    update_stmt = update(User).where(and_(*conditions)).values(**update_data).returning(User)
+    result = await db.execute(update_stmt)
     user = result.scalar_one_or_none()
     
     if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-    
-    # Prevent non-owners from changing owner role
-    if (user_data.role and 
-        user_data.role != user.role and 
-        current_user.role != UserRole.OWNER):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only owners can change user roles"
-        )
-    
-    # Prevent removing last owner
-    if (user_data.role and 
-        user.role == UserRole.OWNER and 
-        user_data.role != UserRole.OWNER):
-        
-        # Check if this is the last owner
-        owner_count_query = select(func.count(User.id)).where(
+        # Cold path: work out which guard rejected the update
+        existing_role = await db.scalar(select(User.role).where(
             and_(
-                User.tenant_id == current_user.tenant_id,
-                User.role == UserRole.OWNER,
-                User.is_active == True
+                User.id == user_id,
+                User.tenant_id == current_user.tenant_id
             )
-        )
-        owner_count_result = await db.execute(owner_count_query)
-        owner_count = owner_count_result.scalar()
-        
-        if owner_count <= 1:
+        ))
+        if existing_role is None:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Cannot remove the last owner from the tenant"
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
             )
-    
-    # Update fields
-    update_data = user_data.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        if hasattr(user, field):
-            setattr(user, field, value)
-        elif field == "preferences" and value is not None:
-            user.preferences = value
+        if current_user.role != UserRole.OWNER:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only owners can change user roles"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot remove the last owner from the tenant"
+        )
     
     await db.commit()
-    await db.refresh(user)
+    await token_cache.invalidate_user(str(user.id))
     
-    return UserResponse.from_orm(user)
+    return ORJSONResponse(_user_response(user))
 
 
 @router.post("/{user_id}/deactivate")
@@ -249,42 +292,39 @@ async def deactivate_user(
             detail="Insufficient permissions to deactivate users"
         )
     
-    # Get existing user
-    query = select(User).where(
+    # Prevent deactivating last owner; the guard rides on the UPDATE, with
+    # the owner rows locked so concurrent deactivations can't both pass it
+    await _lock_active_owners(db, current_user.tenant_id)
+    update_stmt = update(User).where(
         and_(
             User.id == user_id,
-            User.tenant_id == current_user.tenant_id
-        )
-    )
-    result = await db.execute(query)
-    user = result.scalar_one_or_none()
-    
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
+            User.tenant_id == current_user.tenant_id,
+            or_(User.role != UserRole.OWNER, _other_active_owner_exists())
         )
+    ).values(is_active=False).returning(User.id)
+    deactivated_id = await db.scalar(update_stmt)
     
-    # Prevent deactivating last owner
-    if user.role == UserRole.OWNER:
-        owner_count_query = select(func.count(User.id)).where(
+    if deactivated_id is None:
+        # Cold path: missing user, or the last owner
+        exists_query = select(exists().where(
             and_(
-                User.tenant_id == current_user.tenant_id,
-                User.role == UserRole.OWNER,
-                User.is_active == True
+                User.id == user_id,
+                User.tenant_id == current_user.tenant_id
             )
-        )
-        owner_count_result = await db.execute(owner_count_query)
-        owner_count = owner_count_result.scalar()
-        
-        if owner_count <= 1:
+        ))
+        if not await db.scalar(exists_query):
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Cannot deactivate the last owner"
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
             )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot deactivate the last owner"
+        )
     
-    user.is_active = False
     await db.commit()
+    await token_cache.invalidate_user(str(deactivated_id))
+    await auth_service.revoke_refresh_tokens(str(deactivated_id))
     
     return {"message": "User deactivated successfully"}
 
@@ -302,23 +342,19 @@ async def activate_user(
             detail="Insufficient permissions to activate users"
         )
     
-    # Get existing user
-    query = select(User).where(
+    update_stmt = update(User).where(
         and_(
             User.id == user_id,
             User.tenant_id == current_user.tenant_id
         )
-    )
-    result = await db.execute(query)
-    user = result.scalar_one_or_none()
+    ).values(is_active=True).returning(User.id)
     
-    if not user:
+    if await db.scalar(update_stmt) is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
-    user.is_active = True
     await db.commit()
     
     return {"message": "User activated successfully"}
@@ -338,14 +374,12 @@ async def invite_user(
         )
     
     # Check if user already exists
-    existing_user_query = select(User).where(
+    existing_user = await db.scalar(select(exists().where(
         and_(
             User.email == invite_data.email,
             User.tenant_id == current_user.tenant_id
         )
-    )
-    existing_user_result = await db.execute(existing_user_query)
-    existing_user = existing_user_result.scalar_one_or_none()
+    )))
     
     if existing_user:
         raise HTTPException(
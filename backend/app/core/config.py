@@ -3,120 +3,138 @@ Configuration settings for CasePrep backend.
 """
 
 import os
-from typing import Optional, List
-from pydantic_settings import BaseSettings
-from pydantic import Field
+from functools import lru_cache
+from typing import Optional, List, Literal
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import AliasChoices, Field, field_validator
 
 
 class Settings(BaseSettings):
     """Application settings."""
 
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
+
     # Application
     APP_NAME: str = "CasePrep"
     APP_VERSION: str = "1.0.0"
-    DEBUG: bool = Field(default=False, env="DEBUG")
+    ENVIRONMENT: Literal["development", "staging", "production", "testing"] = "development"
+    DEBUG: bool = False
 
     # Security
-    SECRET_KEY: str = Field(..., env="SECRET_KEY")
+    SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
     # Database
-    DATABASE_URL: str = Field(..., env="DATABASE_URL")
+    DATABASE_URL: str
+    # Size against uvicorn workers: each worker process owns its own pool
+    DATABASE_POOL_SIZE: int = Field(
+        default=20, validation_alias=AliasChoices("DB_POOL_SIZE", "DATABASE_POOL_SIZE")
+    )
+    DATABASE_MAX_OVERFLOW: int = Field(
+        default=10, validation_alias=AliasChoices("DB_MAX_OVERFLOW", "DATABASE_MAX_OVERFLOW")
+    )
+    DATABASE_POOL_RECYCLE: int = 1800  # 30 minutes
+    DATABASE_POOL_TIMEOUT: int = 10  # seconds
+    # Connections opened at startup so early requests don't pay for connects
+    DATABASE_POOL_MIN_SIZE: int = 5
+    # Compiled-statement cache entries per engine (SQLAlchemy default is 500)
+    DATABASE_QUERY_CACHE_SIZE: int = 1200
 
     # Redis
-    REDIS_URL: str = Field(default="redis://localhost:6379", env="REDIS_URL")
+    REDIS_URL: str = "redis://localhost:6379"
 
     # Storage
-    STORAGE_BACKEND: str = Field(default="local", env="STORAGE_BACKEND")  # local, s3, minio
-    STORAGE_PATH: str = Field(default="/tmp/caseprep", env="STORAGE_PATH")
+    STORAGE_BACKEND: Literal["local", "s3", "minio"] = "local"
+    STORAGE_PATH: str = "/tmp/caseprep"
 
     # S3/MinIO Configuration
-    S3_ENDPOINT: Optional[str] = Field(default=None, env="S3_ENDPOINT")
-    S3_ACCESS_KEY: Optional[str] = Field(default=None, env="S3_ACCESS_KEY")
-    S3_SECRET_KEY: Optional[str] = Field(default=None, env="S3_SECRET_KEY")
-    S3_BUCKET: Optional[str] = Field(default=None, env="S3_BUCKET")
-    S3_REGION: Optional[str] = Field(default=None, env="S3_REGION")
-    S3_USE_SSL: bool = Field(default=True, env="S3_USE_SSL")
+    S3_ENDPOINT: Optional[str] = None
+    S3_ACCESS_KEY: Optional[str] = None
+    S3_SECRET_KEY: Optional[str] = None
+    S3_BUCKET: Optional[str] = None
+    S3_REGION: Optional[str] = None
+    S3_USE_SSL: bool = True
 
     # File Upload
-    MAX_UPLOAD_SIZE: int = Field(default=2 * 1024 * 1024 * 1024, env="MAX_UPLOAD_SIZE")  # 2GB
+    MAX_UPLOAD_SIZE: int = 2 * 1024 * 1024 * 1024  # 2GB
     ALLOWED_EXTENSIONS: List[str] = Field(
-        default=["mp4", "mov", "avi", "wmv", "flv", "webm", "mp3", "wav", "m4a", "flac", "ogg", "aac"],
-        env="ALLOWED_EXTENSIONS"
+        default=["mp4", "mov", "avi", "wmv", "flv", "webm", "mp3", "wav", "m4a", "flac", "ogg", "aac"]
     )
 
     # Transcription Settings
-    WHISPER_MODEL_SIZE: str = Field(default="large-v3", env="WHISPER_MODEL_SIZE")
-    WHISPER_DEVICE: str = Field(default="cuda" if os.environ.get("CUDA_VISIBLE_DEVICES") else "cpu", env="WHISPER_DEVICE")
-    WHISPER_COMPUTE_TYPE: str = Field(default="float16", env="WHISPER_COMPUTE_TYPE")
-    WHISPER_MODEL_CACHE_DIR: str = Field(default="/tmp/whisper_models", env="WHISPER_MODEL_CACHE_DIR")
+    WHISPER_MODEL_SIZE: str = "large-v3"
+    WHISPER_DEVICE: Literal["cpu", "cuda", "auto"] = "cuda" if os.environ.get("CUDA_VISIBLE_DEVICES") else "cpu"
+    WHISPER_COMPUTE_TYPE: str = "float16"
+    WHISPER_MODEL_CACHE_DIR: str = "/tmp/whisper_models"
 
     # Speaker Diarization
-    ENABLE_DIARIZATION: bool = Field(default=True, env="ENABLE_DIARIZATION")
-    PYANNOTE_AUTH_TOKEN: Optional[str] = Field(default=None, env="PYANNOTE_AUTH_TOKEN")
-    PYANNOTE_MODEL: str = Field(default="pyannote/speaker-diarization-3.1", env="PYANNOTE_MODEL")
+    ENABLE_DIARIZATION: bool = True
+    PYANNOTE_AUTH_TOKEN: Optional[str] = None
+    PYANNOTE_MODEL: str = "pyannote/speaker-diarization-3.1"
 
     # Processing
-    MAX_CONCURRENT_JOBS: int = Field(default=4, env="MAX_CONCURRENT_JOBS")
-    JOB_TIMEOUT_SECONDS: int = Field(default=3600, env="JOB_TIMEOUT_SECONDS")  # 1 hour
+    MAX_CONCURRENT_JOBS: int = 4
+    JOB_TIMEOUT_SECONDS: int = 3600  # 1 hour
 
     # Retention
-    DEFAULT_RETENTION_DAYS: int = Field(default=0, env="DEFAULT_RETENTION_DAYS")
-    MAX_RETENTION_DAYS: int = Field(default=365, env="MAX_RETENTION_DAYS")
+    DEFAULT_RETENTION_DAYS: int = 0
+    MAX_RETENTION_DAYS: int = 365
 
     # CORS
     CORS_ORIGINS: List[str] = Field(
-        default=["http://localhost:3000", "http://localhost:8080"],
-        env="CORS_ORIGINS"
+        default=["http://localhost:3000", "http://localhost:8080"]
     )
 
     # Logging
-    LOG_LEVEL: str = Field(default="INFO", env="LOG_LEVEL")
-    LOG_FORMAT: str = Field(default="json", env="LOG_FORMAT")
+    LOG_LEVEL: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
+    LOG_FORMAT: str = "json"
 
     # Monitoring
-    ENABLE_METRICS: bool = Field(default=True, env="ENABLE_METRICS")
-    METRICS_PORT: int = Field(default=9090, env="METRICS_PORT")
+    ENABLE_METRICS: bool = True
+    METRICS_PORT: int = 9090
+    SENTRY_DSN: Optional[str] = None
 
     # Email (for notifications)
-    SMTP_HOST: Optional[str] = Field(default=None, env="SMTP_HOST")
-    SMTP_PORT: Optional[int] = Field(default=None, env="SMTP_PORT")
-    SMTP_USERNAME: Optional[str] = Field(default=None, env="SMTP_USERNAME")
-    SMTP_PASSWORD: Optional[str] = Field(default=None, env="SMTP_PASSWORD")
-    SMTP_USE_TLS: bool = Field(default=True, env="SMTP_USE_TLS")
+    SMTP_HOST: Optional[str] = None
+    SMTP_PORT: Optional[int] = None
+    SMTP_USERNAME: Optional[str] = None
+    SMTP_PASSWORD: Optional[str] = None
+    SMTP_USE_TLS: bool = True
 
     # Feature Flags
-    ENABLE_ANONYMOUS_LEARNING: bool = Field(default=False, env="ENABLE_ANONYMOUS_LEARNING")
-    ENABLE_CLIENT_SIDE_ENCRYPTION: bool = Field(default=False, env="ENABLE_CLIENT_SIDE_ENCRYPTION")
-    ENABLE_REAL_TIME_PROCESSING: bool = Field(default=False, env="ENABLE_REAL_TIME_PROCESSING")
+    ENABLE_ANONYMOUS_LEARNING: bool = False
+    ENABLE_CLIENT_SIDE_ENCRYPTION: bool = False
+    ENABLE_REAL_TIME_PROCESSING: bool = False
 
     # Performance
-    WORKER_PROCESSES: int = Field(default=1, env="WORKER_PROCESSES")
-    WORKER_THREADS: int = Field(default=4, env="WORKER_THREADS")
+    WORKER_PROCESSES: int = 1
+    WORKER_THREADS: int = 4
 
     # Cache
-    CACHE_TTL: int = Field(default=300, env="CACHE_TTL")  # 5 minutes
-    CACHE_MAX_SIZE: int = Field(default=1000, env="CACHE_MAX_SIZE")
+    CACHE_TTL: int = 300  # 5 minutes
+    CACHE_MAX_SIZE: int = 1000
 
     # Rate Limiting
-    RATE_LIMIT_REQUESTS: int = Field(default=100, env="RATE_LIMIT_REQUESTS")
-    RATE_LIMIT_WINDOW: int = Field(default=60, env="RATE_LIMIT_WINDOW")  # 1 minute
+    RATE_LIMIT_REQUESTS: int = 100
+    RATE_LIMIT_WINDOW: int = 60  # 1 minute
 
     # Backup
-    BACKUP_ENABLED: bool = Field(default=False, env="BACKUP_ENABLED")
-    BACKUP_SCHEDULE: str = Field(default="0 2 * * *", env="BACKUP_SCHEDULE")  # Daily at 2 AM
-    BACKUP_RETENTION_DAYS: int = Field(default=30, env="BACKUP_RETENTION_DAYS")
+    BACKUP_ENABLED: bool = False
+    BACKUP_SCHEDULE: str = "0 2 * * *"  # Daily at 2 AM
+    BACKUP_RETENTION_DAYS: int = 30
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    @field_validator("LOG_LEVEL", mode="before")
+    @classmethod
+    def normalize_log_level(cls, v):
+        """Accept log levels in any case."""
+        return v.upper() if isinstance(v, str) else v
 
 
-# Create settings instance
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """Get application settings, built once per process."""
+    return Settings()
 
 
-def get_settings() -> Settings:
-    """Get application settings."""
-    return settings
\ No newline at end of file
+settings = get_settings()
@@ -2,6 +2,7 @@
 Database configuration and session management.
 """
 
+import asyncio
 import contextlib
 from typing import AsyncIterator
 
@@ -9,8 +10,7 @@ from sqlalchemy import MetaData, create_engine, event, Engine
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session
-
-from app.core.config import get_settings
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 
 # Database metadata with naming conventions for migrations
@@ -44,6 +44,26 @@ class DatabaseSessionManager:
         self._engine = None
         self._sessionmaker = None
 
+    async def warm_pool(self, size: int):
+        """
+        Open up to ``size`` pooled connections and return them to the pool.
+
+        SQLAlchemy's queue pool has no minimum size and connects lazily, so
+        without this the first burst of requests pays for every connect.
+        Warm-up is best effort; connections that fail to open are skipped.
+        """
+        if self._engine is None:
+            raise Exception("DatabaseSessionManager is not initialized")
+
+        size = min(size, self._engine.pool.size())
+        connections = await asyncio.gather(
+            *(self._engine.connect().start() for _ in range(size)),
+            return_exceptions=True,
+        )
+        for connection in connections:
+            if not isinstance(connection, BaseException):
+                await connection.close()
+
     @contextlib.asynccontextmanager
     async def connect(self) -> AsyncIterator[AsyncSession]:
         if self._engine is None:
@@ -75,14 +95,21 @@ class DatabaseSessionManager:
 
     def init(self, host: str, **kwargs):
         """Initialize the database session manager."""
+        # Imported here so importing this module (e.g. for Base) does not
+        # build Settings
+        from app.core.config import get_settings
         settings = get_settings()
 
         engine_kwargs = {
             "echo": settings.DEBUG,
+            # Pin the async-safe queue pool so a pooling regression is explicit
+            "poolclass": AsyncAdaptedQueuePool,
             "pool_size": settings.DATABASE_POOL_SIZE,
             "max_overflow": settings.DATABASE_MAX_OVERFLOW,
             "pool_pre_ping": True,
-            "pool_recycle": 300,  # 5 minutes
+            "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+            "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+            "query_cache_size": settings.DATABASE_QUERY_CACHE_SIZE,
             **kwargs
         }
 
@@ -102,11 +129,13 @@ sessionmanager = DatabaseSessionManager()
 # Synchronous engine for Alembic migrations
 def get_sync_engine():
     """Get synchronous engine for Alembic migrations."""
+    from app.core.config import get_settings
     settings = get_settings()
+    # One-shot use: a pool (and pre-ping round trips) would only add overhead
     return create_engine(
         settings.DATABASE_URL_SYNC,
         echo=settings.DEBUG,
-        pool_pre_ping=True,
+        poolclass=NullPool,
     )
 
 
@@ -117,7 +146,8 @@ def get_sync_session() -> Session:
     return Session(engine)
 
 
-# Dependency to get database session
+# Dependency to get database session; a fresh AsyncSession per request,
+# never shared across requests or tasks
 async def get_db() -> AsyncIterator[AsyncSession]:
     async with sessionmanager.session() as session:
         yield session
@@ -0,0 +1,61 @@
+"""
+Request-scoped loaders for tenant-owned rows.
+"""
+
+import uuid
+from typing import Any, Dict, Hashable, Optional, Tuple, Type, TypeVar
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+ModelT = TypeVar("ModelT")
+
+RequestCache = Dict[Tuple[str, Hashable, Optional[Hashable]], Any]
+
+
+def get_request_cache() -> RequestCache:
+    """Per-request L1 cache; FastAPI resolves this once per request."""
+    return {}
+
+
+async def get_or_404(
+    db: AsyncSession,
+    model: Type[ModelT],
+    pk: Any,
+    tenant_id: Any = None,
+    *,
+    cache: RequestCache,
+    detail: Optional[str] = None,
+) -> ModelT:
+    """
+    Load a row by primary key, scoped to a tenant, or raise 404.
+
+    Goes through ``session.get()``, so a row already in the session's
+    identity map costs no SQL and no statement is built otherwise. Repeated
+    lookups within a request are also served from ``cache``. Pass
+    ``tenant_id=None`` for models that are not tenant-scoped (e.g.
+    ``Tenant`` itself). A malformed ID is treated as not found.
+    """
+    key = (model.__name__, str(pk), str(tenant_id) if tenant_id is not None else None)
+    if key in cache:
+        return cache[key]
+
+    not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=detail or f"{model.__name__} not found"
+    )
+
+    # Identity-map keys are UUID objects; a string ID would always miss
+    if not isinstance(pk, uuid.UUID):
+        try:
+            pk = uuid.UUID(str(pk))
+        except ValueError:
+            raise not_found
+
+    obj = await db.get(model, pk)
+
+    if obj is None or (tenant_id is not None and str(obj.tenant_id) != str(tenant_id)):
+        raise not_found
+
+    cache[key] = obj
+    return obj
@@ -0,0 +1,69 @@
+"""
+Pure ASGI middleware for the CasePrep API.
+
+These avoid Starlette's BaseHTTPMiddleware, which wraps every request in
+an extra task group and memory stream.
+"""
+
+import structlog
+from starlette.datastructures import MutableHeaders
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class RequestIDMiddleware:
+    """
+    Bind a request ID to the logging context and echo it in the response.
+    """
+
+    header_name = "X-Request-ID"
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")
+                break
+        if not request_id:
+            request_id = f"req_{id(scope)}"
+
+        # Add to context for logging
+        structlog.contextvars.bind_contextvars(request_id=request_id)
+
+        async def send_with_request_id(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers[self.header_name] = request_id
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            # Clear context after request
+            structlog.contextvars.clear_contextvars()
+
+
+class CompressionMiddleware:
+    """
+    Gzip JSON and other API responses, skipping file download routes.
+
+    Downloads are media or finished export documents that are already
+    compressed; re-encoding them only burns CPU.
+    """
+
+    skip_path_suffix = "/download"
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, compresslevel: int = 4):
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=compresslevel)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http" and not scope["path"].endswith(self.skip_path_suffix):
+            return await self.gzip(scope, receive, send)
+        return await self.app(scope, receive, send)
@@ -0,0 +1,70 @@
+"""
+Short-lived Redis cache for transcript status payloads served to pollers.
+"""
+
+import hashlib
+import logging
+from typing import Optional
+
+import redis
+from redis.exceptions import RedisError
+
+from app.core.config import get_settings
+from app.core.token_cache import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Clients poll every second or two; writers also invalidate on status changes
+TRANSCRIPT_STATUS_CACHE_TTL = 2  # seconds
+
+_sync_client: Optional[redis.Redis] = None
+
+
+def _status_key(tenant_id: str, transcript_id: str) -> str:
+    return f"transcript:status:{tenant_id}:{transcript_id}"
+
+
+def etag_for(body: str) -> str:
+    """Strong ETag for a serialized status body."""
+    return '"' + hashlib.sha256(body.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+async def get_status(tenant_id: str, transcript_id: str) -> Optional[str]:
+    """Get a cached JSON status body, or None on miss."""
+    try:
+        return await get_redis().get(_status_key(tenant_id, transcript_id))
+    except RedisError as e:
+        logger.warning(f"Transcript status cache read failed: {e}")
+        return None
+
+
+async def set_status(tenant_id: str, transcript_id: str, body: str):
+    """Cache a serialized status body."""
+    try:
+        await get_redis().set(
+            _status_key(tenant_id, transcript_id), body, ex=TRANSCRIPT_STATUS_CACHE_TTL
+        )
+    except RedisError as e:
+        logger.warning(f"Transcript status cache write failed: {e}")
+
+
+async def invalidate(tenant_id: str, transcript_id: str):
+    """Drop a cached status after the transcript status changed."""
+    try:
+        await get_redis().delete(_status_key(tenant_id, transcript_id))
+    except RedisError as e:
+        logger.warning(f"Transcript status cache invalidation failed: {e}")
+
+
+def invalidate_sync(tenant_id: str, transcript_id: str):
+    """
+    Blocking variant for Celery tasks, which run each job in a fresh event
+    loop and so cannot share the API's asyncio client.
+    """
+    global _sync_client
+    try:
+        if _sync_client is None:
+            _sync_client = redis.Redis.from_url(get_settings().REDIS_URL)
+        _sync_client.delete(_status_key(tenant_id, transcript_id))
+    except RedisError as e:
+        logger.warning(f"Transcript status cache invalidation failed: {e}")
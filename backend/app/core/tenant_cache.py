@@ -0,0 +1,47 @@
+"""
+Redis cache-aside store for tenant profiles, keyed by tenant ID.
+"""
+
+import json
+import logging
+from typing import Any, Dict, Optional
+
+from redis.exceptions import RedisError
+
+from app.core.token_cache import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Tenant rows change rarely; keep staleness from other writers short
+TENANT_CACHE_TTL = 60  # seconds
+
+
+def _tenant_key(tenant_id: str) -> str:
+    return f"tenant:{tenant_id}"
+
+
+async def get_tenant(tenant_id: str) -> Optional[Dict[str, Any]]:
+    """Get a cached tenant payload, or None on miss."""
+    try:
+        raw = await get_redis().get(_tenant_key(tenant_id))
+    except RedisError as e:
+        logger.warning(f"Tenant cache read failed: {e}")
+        return None
+
+    return json.loads(raw) if raw else None
+
+
+async def set_tenant(tenant_id: str, data: Dict[str, Any]):
+    """Cache a JSON-safe tenant payload."""
+    try:
+        await get_redis().set(_tenant_key(tenant_id), json.dumps(data), ex=TENANT_CACHE_TTL)
+    except RedisError as e:
+        logger.warning(f"Tenant cache write failed: {e}")
+
+
+async def invalidate(tenant_id: str):
+    """Drop a cached tenant after it has been written."""
+    try:
+        await get_redis().delete(_tenant_key(tenant_id))
+    except RedisError as e:
+        logger.warning(f"Tenant cache invalidation failed: {e}")
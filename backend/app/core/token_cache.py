@@ -0,0 +1,143 @@
+"""
+Redis cache-aside store for authenticated users, keyed by access token hash,
+and revocation state for refresh tokens.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Dict, Optional
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on how long a resolved token is trusted without hitting the DB
+TOKEN_CACHE_MAX_TTL = 300  # 5 minutes
+
+_client: Optional[redis.Redis] = None
+
+
+def get_redis() -> redis.Redis:
+    """Get the process-wide Redis client."""
+    global _client
+    if _client is None:
+        _client = redis.from_url(get_settings().REDIS_URL, decode_responses=True)
+    return _client
+
+
+def hash_token(token: str) -> str:
+    """Hash a bearer token so raw credentials never become cache keys."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _token_key(token_hash: str) -> str:
+    return f"auth:token:{token_hash}"
+
+
+def _user_tokens_key(user_id: str) -> str:
+    return f"user_tokens:{user_id}"
+
+
+def _revoked_refresh_key(jti: str) -> str:
+    return f"auth:refresh_revoked:{jti}"
+
+
+def _refresh_not_before_key(user_id: str) -> str:
+    return f"auth:refresh_not_before:{user_id}"
+
+
+async def get_token(token_hash: str) -> Optional[Dict[str, Any]]:
+    """Get cached user data for a token hash, or None on miss."""
+    try:
+        raw = await get_redis().get(_token_key(token_hash))
+    except RedisError as e:
+        logger.warning(f"Token cache read failed: {e}")
+        return None
+
+    return json.loads(raw) if raw else None
+
+
+async def set_token(token_hash: str, user_id: str, data: Dict[str, Any], exp: int):
+    """
+    Cache user data for a token hash.
+
+    The TTL is capped at the token's own expiry so a cached entry never
+    outlives the credential it was resolved from.
+    """
+    ttl = min(int(exp - time.time()), TOKEN_CACHE_MAX_TTL)
+    if ttl <= 0:
+        return
+
+    try:
+        async with get_redis().pipeline(transaction=True) as pipe:
+            pipe.set(_token_key(token_hash), json.dumps(data), ex=ttl)
+            pipe.sadd(_user_tokens_key(user_id), token_hash)
+            pipe.expire(_user_tokens_key(user_id), TOKEN_CACHE_MAX_TTL)
+            await pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Token cache write failed: {e}")
+
+
+async def invalidate(token_hash: str):
+    """Drop a single cached token."""
+    try:
+        await get_redis().delete(_token_key(token_hash))
+    except RedisError as e:
+        logger.warning(f"Token cache invalidation failed: {e}")
+
+
+async def invalidate_user(user_id: str):
+    """Drop every cached token belonging to a user."""
+    user_key = _user_tokens_key(user_id)
+    try:
+        client = get_redis()
+        token_hashes = await client.smembers(user_key)
+        keys = [_token_key(token_hash) for token_hash in token_hashes]
+        await client.delete(user_key, *keys)
+    except RedisError as e:
+        logger.warning(f"Token cache invalidation failed for user {user_id}: {e}")
+
+
+async def revoke_refresh_token(jti: str, exp: int):
+    """Revoke a single refresh token until it would have expired anyway."""
+    ttl = int(exp - time.time())
+    if ttl <= 0:
+        return
+
+    try:
+        await get_redis().set(_revoked_refresh_key(jti), 1, ex=ttl)
+    except RedisError as e:
+        logger.warning(f"Refresh token revocation failed: {e}")
+
+
+async def revoke_user_refresh_tokens(user_id: str, ttl: int):
+    """Revoke every refresh token issued to a user before now."""
+    try:
+        await get_redis().set(_refresh_not_before_key(user_id), int(time.time()), ex=ttl)
+    except RedisError as e:
+        logger.warning(f"Refresh token revocation failed for user {user_id}: {e}")
+
+
+async def is_refresh_token_revoked(jti: str, user_id: str, issued_at: int) -> Optional[bool]:
+    """
+    Check refresh token revocation.
+
+    Returns None when Redis is unavailable so callers can fall back to
+    the database instead of trusting the token blindly.
+    """
+    try:
+        revoked, not_before = await get_redis().mget(
+            _revoked_refresh_key(jti), _refresh_not_before_key(user_id)
+        )
+    except RedisError as e:
+        logger.warning(f"Refresh token revocation check failed: {e}")
+        return None
+
+    if revoked is not None:
+        return True
+    return not_before is not None and issued_at < int(not_before)
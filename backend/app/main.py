@@ -10,7 +10,7 @@ import sentry_sdk
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from sentry_sdk.integrations.fastapi import FastApiIntegration
 from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
 
@@ -19,6 +19,7 @@ from app.core.config import get_settings
 from app.core.database import engine, sessionmanager
 from app.core.exceptions import CasePrepException
 from app.core.logging import configure_logging
+from app.core.middleware import CompressionMiddleware, RequestIDMiddleware
 
 
 # Configure structured logging
@@ -34,7 +35,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Starting CasePrep API...")
     
     # Initialize database
-    sessionmanager.init(get_settings().DATABASE_URL)
+    settings = get_settings()
+    sessionmanager.init(settings.DATABASE_URL)
+    await sessionmanager.warm_pool(settings.DATABASE_POOL_MIN_SIZE)
     
     yield
     
@@ -75,6 +78,8 @@ def create_application() -> FastAPI:
         docs_url="/api/docs" if settings.ENVIRONMENT != "production" else None,
         redoc_url="/api/redoc" if settings.ENVIRONMENT != "production" else None,
         lifespan=lifespan,
+        # orjson for every route; it encodes datetimes, UUIDs and enums natively
+        default_response_class=ORJSONResponse,
         # Security headers
         swagger_ui_parameters={
             "displayRequestDuration": True,
@@ -106,24 +111,14 @@ def create_application() -> FastAPI:
             "X-Request-ID",
             "X-Correlation-ID",
         ],
-        expose_headers=["X-Request-ID", "X-Correlation-ID"],
+        expose_headers=["X-Request-ID", "X-Correlation-ID", "X-Next-Cursor", "ETag"],
     )
     
     # Request ID Middleware
-    @app.middleware("http")
-    async def add_request_id_header(request: Request, call_next):
-        request_id = request.headers.get("X-Request-ID") or f"req_{id(request)}"
-        
-        # Add to context for logging
-        structlog.contextvars.bind_contextvars(request_id=request_id)
-        
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
-        
-        # Clear context after request
-        structlog.contextvars.clear_contextvars()
-        
-        return response
+    app.add_middleware(RequestIDMiddleware)
+    
+    # Response compression; transcript JSON is large and highly repetitive
+    app.add_middleware(CompressionMiddleware, minimum_size=1024, compresslevel=4)
     
     # Global Exception Handler
     @app.exception_handler(CasePrepException)
@@ -137,7 +132,7 @@ def create_application() -> FastAPI:
             path=request.url.path,
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={
                 "error": {
@@ -158,7 +153,7 @@ def create_application() -> FastAPI:
             path=request.url.path,
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "error": {
@@ -194,7 +189,7 @@ def create_application() -> FastAPI:
             }
         except Exception as e:
             logger.error("Readiness check failed", error=str(e))
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 content={
                     "status": "not_ready",
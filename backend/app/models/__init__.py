@@ -7,6 +7,7 @@ from .user import User, Tenant, UserRole, SubscriptionPlan
 from .matter import Matter, MatterParticipant, MatterNote, MatterDocument, MatterStatus, MatterPriority
 from .media import MediaAsset, MediaStatus, MediaType
 from .transcript import Transcript, TranscriptSegment, TranscriptStatus, TranscriptFormat, SpeakerRole
+from .export import Export, ExportFormat, ExportStatus, ExportType
 
 __all__ = [
     # Base models
@@ -39,4 +40,10 @@ __all__ = [
     "TranscriptStatus",
     "TranscriptFormat",
     "SpeakerRole",
+    
+    # Export models
+    "Export",
+    "ExportFormat",
+    "ExportStatus",
+    "ExportType",
 ]
\ No newline at end of file
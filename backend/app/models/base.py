@@ -76,6 +76,9 @@ class BaseModel(Base, UUIDMixin, TimestampMixin):
     """
     
     __abstract__ = True
+    # Fetch server-generated values (created_at, updated_at, computed
+    # columns) with RETURNING on flush, so writes never need a refresh()
+    __mapper_args__ = {"eager_defaults": True}
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert model instance to dictionary."""
@@ -0,0 +1,88 @@
+"""
+Export job models for generated transcript and report files.
+"""
+
+from sqlalchemy import Column, String, Text, Integer, DateTime, Index, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+import enum
+
+from app.models.base import BaseTenantModel
+
+
+class ExportFormat(str, enum.Enum):
+    """Export format options."""
+    PDF = "pdf"
+    DOCX = "docx"
+    TXT = "txt"
+    JSON = "json"
+    CSV = "csv"
+    XLSX = "xlsx"
+
+
+class ExportStatus(str, enum.Enum):
+    """Export processing status."""
+    PENDING = "pending"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ExportType(str, enum.Enum):
+    """Type of export."""
+    TRANSCRIPT = "transcript"
+    MATTER_SUMMARY = "matter_summary"
+    USER_REPORT = "user_report"
+    USAGE_REPORT = "usage_report"
+
+
+class Export(BaseTenantModel):
+    """
+    Export job model tracking generated files for a tenant.
+    """
+
+    __tablename__ = "exports"
+
+    # Export definition
+    export_type = Column(SQLEnum(ExportType), nullable=False)
+    format = Column(SQLEnum(ExportFormat), nullable=False)
+    resource_id = Column(String(255), nullable=False)
+    options = Column(JSONB, default=dict, nullable=False)
+
+    # Requesting user
+    user_id = Column(UUID(as_uuid=True), nullable=False)
+
+    # Processing status
+    status = Column(SQLEnum(ExportStatus), default=ExportStatus.PENDING, nullable=False)
+    error_message = Column(Text, nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    expires_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Output file
+    filename = Column(String(500), nullable=False)
+    file_size = Column(Integer, nullable=True)  # bytes
+    storage_path = Column(String(1000), nullable=True)
+
+    def __repr__(self):
+        return f"<Export(id={self.id}, type='{self.export_type.value}', status='{self.status.value}')>"
+
+    @property
+    def is_ready(self) -> bool:
+        """Check if the export file is ready for download."""
+        return self.status == ExportStatus.COMPLETED
+
+    @property
+    def download_url(self):
+        """Get download URL for completed exports."""
+        if not self.is_ready:
+            return None
+        return f"/api/v1/exports/{self.id}/download"
+
+
+# Serves the tenant-scoped listing: filters on status/type, newest first
+Index(
+    "ix_exports_tenant_status_type_created",
+    Export.tenant_id,
+    Export.status,
+    Export.export_type,
+    Export.created_at.desc(),
+)
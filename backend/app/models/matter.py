@@ -2,7 +2,8 @@
 Matter (case) models for legal case management.
 """
 
-from sqlalchemy import Column, String, Text, Boolean, Integer, Enum as SQLEnum, Numeric
+from sqlalchemy import Column, String, Text, Boolean, Integer, Float, Index, Enum as SQLEnum, Numeric, cast, func
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 import enum
@@ -98,16 +99,26 @@ class Matter(BaseTenantAuditModel):
         # Would need to access tenant.data_retention_days
         return 0
     
-    @property
+    @hybrid_property
     def total_duration_hours(self) -> float:
         """Get total duration in hours."""
         return self.total_duration_ms / (1000 * 60 * 60) if self.total_duration_ms else 0
     
-    @property
+    @total_duration_hours.expression
+    def total_duration_hours(cls):
+        """Compute total duration in hours in SQL."""
+        return cast(func.coalesce(cls.total_duration_ms, 0) / (1000.0 * 60 * 60), Float)
+    
+    @hybrid_property
     def total_storage_mb(self) -> float:
         """Get total storage in MB."""
         return self.total_storage_bytes / (1024 * 1024) if self.total_storage_bytes else 0
     
+    @total_storage_mb.expression
+    def total_storage_mb(cls):
+        """Compute total storage in MB in SQL."""
+        return cast(func.coalesce(cls.total_storage_bytes, 0) / (1024.0 * 1024), Float)
+    
     def add_tag(self, tag: str):
         """Add a tag to the matter."""
         if self.tags is None:
@@ -142,6 +153,32 @@ class Matter(BaseTenantAuditModel):
         self.total_storage_bytes = max(0, self.total_storage_bytes)
 
 
+# Text searched by list_matters; the trigram index below is built on this
+# exact expression, so queries must use it verbatim to hit the index
+matter_search_text = (
+    Matter.title
+    + " " + func.coalesce(Matter.description, "")
+    + " " + func.coalesce(Matter.case_number, "")
+    + " " + func.coalesce(Matter.client_name, "")
+)
+
+# Serves the tenant-scoped listing presorted by updated_at for LIMIT windows
+Index(
+    "ix_matters_tenant_updated",
+    Matter.tenant_id,
+    Matter.updated_at.desc(),
+    postgresql_include=["status", "priority", "practice_area", "title"],
+)
+
+# Substring search across title/description/case number/client (pg_trgm)
+Index(
+    "ix_matters_search",
+    matter_search_text.label("matter_search_text"),
+    postgresql_using="gin",
+    postgresql_ops={"matter_search_text": "gin_trgm_ops"},
+)
+
+
 class MatterParticipant(BaseTenantAuditModel):
     """
     Participants in a legal matter (attorneys, clients, witnesses, etc.).
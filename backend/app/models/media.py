@@ -2,7 +2,7 @@
 Media asset models for file uploads and storage.
 """
 
-from sqlalchemy import Column, String, Text, Boolean, Integer, Enum as SQLEnum, Numeric
+from sqlalchemy import Column, String, Text, Boolean, Integer, Index, Enum as SQLEnum, Numeric
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 import enum
@@ -45,6 +45,7 @@ class MediaAsset(BaseTenantAuditModel):
     storage_path = Column(String(1000), nullable=False)
     storage_provider = Column(String(50), default="local", nullable=False)  # local, s3, etc.
     content_hash = Column(String(64), nullable=False, index=True)  # SHA-256
+    prefix_hash = Column(String(32), nullable=True)  # SHA-256 of head/tail/size, truncated
 
     # Processing status
     status = Column(SQLEnum(MediaStatus), default=MediaStatus.UPLOADED, nullable=False, index=True)
@@ -178,4 +179,28 @@ class MediaAsset(BaseTenantAuditModel):
         """Get storage URL (implementation depends on storage provider)."""
         # This would generate signed URLs for private files
         # Implementation depends on storage provider (S3, local, etc.)
-        return f"/api/v1/media/{self.id}/download"
\ No newline at end of file
+        return f"/api/v1/media/{self.id}/download"
+
+
+# Serves the upload duplicate probe: (tenant, size, head/tail fingerprint)
+Index(
+    "ix_media_assets_tenant_size_prefix",
+    MediaAsset.tenant_id,
+    MediaAsset.file_size,
+    MediaAsset.prefix_hash,
+)
+
+# One copy of any given content per tenant; backs the upload duplicate check
+Index(
+    "ix_media_assets_tenant_content_hash",
+    MediaAsset.tenant_id,
+    MediaAsset.content_hash,
+    unique=True,
+)
+
+# Tenant-scoped media list, newest first
+Index(
+    "ix_media_assets_tenant_updated",
+    MediaAsset.tenant_id,
+    MediaAsset.updated_at.desc(),
+)
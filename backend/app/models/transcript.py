@@ -2,8 +2,8 @@
 Transcript and transcript segment models for transcription results.
 """
 
-from sqlalchemy import Column, String, Text, Boolean, Integer, Enum as SQLEnum, Numeric
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, String, Text, Boolean, Integer, Index, Computed, Enum as SQLEnum, Numeric, func
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
 from sqlalchemy.orm import relationship
 import enum
 
@@ -97,6 +97,17 @@ class Transcript(BaseTenantAuditModel):
     tags = Column(JSONB, default=list, nullable=False)
     notes = Column(Text, nullable=True)
     
+    # Full-text search document, maintained by Postgres
+    search_tsv = Column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('simple', coalesce(title, '') || ' ' || "
+            "coalesce(content, '') || ' ' || coalesce(notes, ''))",
+            persisted=True,
+        ),
+        nullable=True,
+    )
+    
     # Analytics
     view_count = Column(Integer, default=0, nullable=False)
     download_count = Column(Integer, default=0, nullable=False)
@@ -208,6 +219,62 @@ class Transcript(BaseTenantAuditModel):
             self.review_notes = notes
 
 
+# Full-text search over title/content/notes
+Index("ix_transcripts_search_tsv", Transcript.search_tsv, postgresql_using="gin")
+
+# Substring (ILIKE) search on title/notes for partial-word matches (pg_trgm)
+Index(
+    "ix_transcripts_title_trgm",
+    Transcript.title,
+    postgresql_using="gin",
+    postgresql_ops={"title": "gin_trgm_ops"},
+)
+Index(
+    "ix_transcripts_notes_trgm",
+    Transcript.notes,
+    postgresql_using="gin",
+    postgresql_ops={"notes": "gin_trgm_ops"},
+)
+
+# Case-folded title for prefix search; the pattern-ops index below is built
+# on this exact expression, so queries must use it verbatim to hit the index
+transcript_title_lower = func.lower(Transcript.title)
+
+# Left-anchored LIKE on the case-folded title, independent of collation
+Index(
+    "ix_transcripts_title_lower_prefix",
+    transcript_title_lower.label("title_lower"),
+    postgresql_ops={"title_lower": "text_pattern_ops"},
+)
+
+# Tenant-scoped listings ordered by most recently updated
+Index(
+    "ix_transcripts_tenant_updated",
+    Transcript.tenant_id,
+    Transcript.updated_at.desc(),
+)
+Index(
+    "ix_transcripts_tenant_matter_updated",
+    Transcript.tenant_id,
+    Transcript.matter_id,
+    Transcript.updated_at.desc(),
+)
+Index(
+    "ix_transcripts_tenant_status_updated",
+    Transcript.tenant_id,
+    Transcript.status,
+    Transcript.updated_at.desc(),
+)
+
+
+def _mmss_sql(column: str) -> str:
+    """SQL rendering a millisecond column as zero-padded MM:SS."""
+    return (
+        f"CASE WHEN {column} < 600000 THEN '0' ELSE '' END || ({column} / 60000)::text"
+        f" || ':' || lpad((({column} / 1000) % 60)::text, 2, '0')"
+    )
+
+
 class TranscriptSegment(BaseTenantAuditModel):
     """
     Individual transcript segments with timing and speaker information.
@@ -251,6 +318,20 @@ class TranscriptSegment(BaseTenantAuditModel):
     # Custom fields
     custom_fields = Column(JSONB, default=dict, nullable=False)
     
+    # Display strings for exports, formatted once by Postgres on write
+    start_time_formatted = Column(Text, Computed(_mmss_sql("start_time"), persisted=True), nullable=True)  # MM:SS
+    end_time_formatted = Column(Text, Computed(_mmss_sql("end_time"), persisted=True), nullable=True)  # MM:SS
+    display_speaker = Column(
+        Text,
+        Computed(
+            "coalesce(nullif(speaker_name, ''), "
+            "replace(nullif(speaker_id, ''), 'SPEAKER_', 'Speaker '), "
+            "'Unknown Speaker')",
+            persisted=True,
+        ),
+        nullable=True,
+    )
+    
     # Relationships
     transcript = relationship("Transcript", back_populates="segments")
     
@@ -272,22 +353,6 @@ class TranscriptSegment(BaseTenantAuditModel):
         """Get duration in seconds."""
         return self.duration / 1000
     
-    @property
-    def start_time_formatted(self) -> str:
-        """Get formatted start time (MM:SS)."""
-        total_seconds = self.start_time_seconds
-        minutes = int(total_seconds // 60)
-        seconds = int(total_seconds % 60)
-        return f"{minutes:02d}:{seconds:02d}"
-    
-    @property
-    def end_time_formatted(self) -> str:
-        """Get formatted end time (MM:SS)."""
-        total_seconds = self.end_time_seconds
-        minutes = int(total_seconds // 60)
-        seconds = int(total_seconds % 60)
-        return f"{minutes:02d}:{seconds:02d}"
-    
     @property
     def time_range_formatted(self) -> str:
         """Get formatted time range."""
@@ -298,16 +363,6 @@ class TranscriptSegment(BaseTenantAuditModel):
         """Check if segment has speaker information."""
         return self.speaker_id is not None or self.speaker_name is not None
     
-    @property
-    def display_speaker(self) -> str:
-        """Get display name for speaker."""
-        if self.speaker_name:
-            return self.speaker_name
-        elif self.speaker_id:
-            return self.speaker_id.replace("SPEAKER_", "Speaker ")
-        else:
-            return "Unknown Speaker"
-    
     def edit_text(self, new_text: str, user_id: str):
         """Edit the segment text."""
         if not self.is_edited:
@@ -337,4 +392,13 @@ class TranscriptSegment(BaseTenantAuditModel):
     
     def get_custom_field(self, key: str, default=None):
         """Get a custom field value."""
-        return self.custom_fields.get(key, default) if self.custom_fields else default
\ No newline at end of file
+        return self.custom_fields.get(key, default) if self.custom_fields else default
+
+
+# Ordered segment reads for a transcript; timing/speaker served from the index
+Index(
+    "ix_transcript_segments_transcript_index",
+    TranscriptSegment.transcript_id,
+    TranscriptSegment.segment_index,
+    postgresql_include=["start_time", "end_time", "speaker_id"],
+)
@@ -2,7 +2,7 @@
 User and tenant models for authentication and authorization.
 """
 
-from sqlalchemy import Column, String, Text, Boolean, Integer, Enum as SQLEnum
+from sqlalchemy import Column, String, Text, Boolean, Integer, Index, Enum as SQLEnum, and_, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 import enum
@@ -18,6 +18,45 @@ class UserRole(enum.Enum):
     VIEWER = "viewer"
 
 
+# Stable bit index per permission; append only so masks never shift
+PERMISSIONS = [
+    "matter:create", "matter:read", "matter:update", "matter:delete",
+    "transcript:create", "transcript:read", "transcript:update", "transcript:delete",
+    "user:invite", "user:read", "user:update",
+    "export:create", "export:read",
+]
+PERMISSION_BITS = {permission: 1 << index for index, permission in enumerate(PERMISSIONS)}
+
+# Unlisted permissions map here; only the owner's all-bits mask includes it
+_UNLISTED_PERMISSION_BIT = 1 << len(PERMISSIONS)
+
+
+def _permission_mask(*permissions: str) -> int:
+    mask = 0
+    for permission in permissions:
+        mask |= PERMISSION_BITS[permission]
+    return mask
+
+
+ROLE_PERMISSION_MASKS = {
+    UserRole.OWNER: -1,  # All permissions
+    UserRole.ADMIN: _permission_mask(
+        "matter:create", "matter:read", "matter:update", "matter:delete",
+        "transcript:create", "transcript:read", "transcript:update", "transcript:delete",
+        "user:invite", "user:read", "user:update",
+        "export:create", "export:read"
+    ),
+    UserRole.EDITOR: _permission_mask(
+        "matter:read", "matter:update",
+        "transcript:create", "transcript:read", "transcript:update",
+        "export:create", "export:read"
+    ),
+    UserRole.VIEWER: _permission_mask(
+        "matter:read", "transcript:read", "export:read"
+    ),
+}
+
+
 class SubscriptionPlan(enum.Enum):
     """Subscription plan types."""
     STARTER = "starter"
@@ -180,28 +219,16 @@ class User(BaseTenantModel):
             return self.display_name[0].upper()
         return self.email[0].upper()
     
+    @property
+    def permission_mask(self) -> int:
+        """Get the permission bitmask for the user's role."""
+        return ROLE_PERMISSION_MASKS.get(self.role, 0)
+    
     def has_permission(self, permission: str) -> bool:
         """Check if user has a specific permission."""
-        role_permissions = {
-            UserRole.OWNER: ["*"],  # All permissions
-            UserRole.ADMIN: [
-                "matter:create", "matter:read", "matter:update", "matter:delete",
-                "transcript:create", "transcript:read", "transcript:update", "transcript:delete",
-                "user:invite", "user:read", "user:update",
-                "export:create", "export:read"
-            ],
-            UserRole.EDITOR: [
-                "matter:read", "matter:update",
-                "transcript:create", "transcript:read", "transcript:update",
-                "export:create", "export:read"
-            ],
-            UserRole.VIEWER: [
-                "matter:read", "transcript:read", "export:read"
-            ]
-        }
-        
-        permissions = role_permissions.get(self.role, [])
-        return "*" in permissions or permission in permissions
+        return bool(
+            self.permission_mask & PERMISSION_BITS.get(permission, _UNLISTED_PERMISSION_BIT)
+        )
     
     def get_preference(self, key: str, default=None):
         """Get a user preference."""
@@ -222,4 +249,36 @@ class User(BaseTenantModel):
     def remove_oauth_provider(self, provider: str):
         """Remove OAuth provider data."""
         if self.oauth_providers and provider in self.oauth_providers:
-            del self.oauth_providers[provider]
\ No newline at end of file
+            del self.oauth_providers[provider]
+
+
+# Text searched by list_users; the trigram index below is built on this
+# exact expression, so queries must use it verbatim to hit the index
+user_search_text = (
+    User.email
+    + " " + func.coalesce(User.first_name, "")
+    + " " + func.coalesce(User.last_name, "")
+    + " " + func.coalesce(User.display_name, "")
+)
+
+# Substring search across email and names (pg_trgm)
+Index(
+    "ix_users_search",
+    user_search_text.label("user_search_text"),
+    postgresql_using="gin",
+    postgresql_ops={"user_search_text": "gin_trgm_ops"},
+)
+
+# Tenant user listing, newest first
+Index(
+    "ix_users_tenant_created",
+    User.tenant_id,
+    User.created_at.desc(),
+)
+
+# Active owners per tenant, for the "last owner" guard on role changes
+Index(
+    "ix_users_tenant_active_owner",
+    User.tenant_id,
+    postgresql_where=and_(User.role == UserRole.OWNER, User.is_active == True),
+)
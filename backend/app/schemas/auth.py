@@ -3,8 +3,9 @@ Pydantic schemas for authentication endpoints.
 """
 
 from typing import Optional
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, EmailStr, Field, field_validator, ConfigDict
 from datetime import datetime
+from uuid import UUID
 
 from app.models.user import UserRole, SubscriptionPlan
 
@@ -41,7 +42,8 @@ class UserCreate(BaseModel):
     last_name: str = Field(..., min_length=1, max_length=100)
     firm_name: str = Field(..., min_length=1, max_length=255)
 
-    @validator('password')
+    @field_validator('password')
+    @classmethod
     def validate_password(cls, v):
         """Validate password strength."""
         if len(v) < 8:
@@ -58,7 +60,8 @@ class UserCreate(BaseModel):
 
         return v
 
-    @validator('firm_name')
+    @field_validator('firm_name')
+    @classmethod
     def validate_firm_name(cls, v):
         """Validate firm name."""
         if not v.strip():
@@ -68,7 +71,7 @@ class UserCreate(BaseModel):
 
 class UserResponse(BaseModel):
     """User response schema."""
-    id: str
+    id: UUID
     email: EmailStr
     first_name: Optional[str] = None
     last_name: Optional[str] = None
@@ -77,16 +80,14 @@ class UserResponse(BaseModel):
     role: UserRole
     is_active: bool
     is_verified: bool
-    tenant_id: str
+    tenant_id: UUID
     created_at: datetime
     last_login_at: Optional[datetime] = None
     preferences: dict = {}
     timezone: str = "UTC"
     language: str = "en"
 
-    class Config:
-        from_attributes = True
-        use_enum_values = True
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
 
 class UserUpdate(BaseModel):
@@ -109,7 +110,8 @@ class PasswordResetConfirm(BaseModel):
     token: str
     new_password: str = Field(..., min_length=8)
 
-    @validator('new_password')
+    @field_validator('new_password')
+    @classmethod
     def validate_password(cls, v):
         """Validate password strength."""
         if len(v) < 8:
@@ -130,7 +132,8 @@ class PasswordChange(BaseModel):
     current_password: str
     new_password: str = Field(..., min_length=8)
 
-    @validator('new_password')
+    @field_validator('new_password')
+    @classmethod
     def validate_password(cls, v):
         """Validate password strength."""
         if len(v) < 8:
@@ -170,9 +173,7 @@ class TenantResponse(BaseModel):
     features: dict = {}
     settings: dict = {}
 
-    class Config:
-        from_attributes = True
-        use_enum_values = True
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
 
 class OAuthProvider(BaseModel):
@@ -2,15 +2,21 @@
 Authentication service for user management and JWT token handling.
 """
 
-from typing import Optional
+import enum
+import time
+import uuid
+from typing import Any, Dict, Optional
 from datetime import datetime, timedelta
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, exists, DateTime, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import make_transient_to_detached
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
+from app.core import token_cache
 from app.core.config import get_settings
 from app.core.database import get_db
 from app.core.exceptions import AuthenticationError, ValidationError
@@ -20,6 +26,9 @@ from app.schemas.auth import UserCreate, UserLogin, Token, TokenData
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login")
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Credentials are never written to the token cache
+_CACHE_EXCLUDED_COLUMNS = frozenset({"hashed_password", "mfa_secret", "backup_codes"})
+
 
 class AuthService:
     """Authentication service for user management."""
@@ -58,7 +67,12 @@ class AuthService:
         to_encode = data.copy()
         expire = datetime.utcnow() + timedelta(minutes=self.refresh_token_expire_minutes)
 
-        to_encode.update({"exp": expire, "iat": datetime.utcnow(), "type": "refresh"})
+        to_encode.update({
+            "exp": expire,
+            "iat": datetime.utcnow(),
+            "type": "refresh",
+            "jti": uuid.uuid4().hex
+        })
         encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
 
         return encoded_jwt
@@ -87,6 +101,43 @@ class AuthService:
         except JWTError:
             raise AuthenticationError("Could not validate credentials")
 
+    def _user_to_cache(self, user: User) -> Dict[str, Any]:
+        """Serialize user columns for the token cache."""
+        data = {}
+        for column in User.__table__.columns:
+            if column.key in _CACHE_EXCLUDED_COLUMNS:
+                continue
+            value = getattr(user, column.key)
+            if isinstance(value, enum.Enum):
+                value = value.value
+            elif isinstance(value, uuid.UUID):
+                value = str(value)
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            data[column.key] = value
+        return data
+
+    def _user_from_cache(self, data: Dict[str, Any]) -> User:
+        """Rebuild a detached user from token cache data."""
+        values = {}
+        for column in User.__table__.columns:
+            if column.key not in data:
+                continue
+            value = data[column.key]
+            if value is not None:
+                if isinstance(column.type, SQLEnum):
+                    value = column.type.enum_class(value)
+                elif isinstance(column.type, UUID):
+                    value = uuid.UUID(value)
+                elif isinstance(column.type, DateTime):
+                    value = datetime.fromisoformat(value)
+            values[column.key] = value
+
+        user = User(**values)
+        # Mark as already persisted so it can join a session without a SELECT
+        make_transient_to_detached(user)
+        return user
+
     async def get_user_by_email(self, db: AsyncSession, email: str) -> Optional[User]:
         """Get user by email address."""
         query = select(User).where(User.email == email)
@@ -137,7 +188,13 @@ class AuthService:
         )
 
     async def refresh_access_token(self, db: AsyncSession, refresh_token: str) -> Token:
-        """Refresh access token using refresh token."""
+        """
+        Refresh access token using refresh token.
+
+        The refresh token is trusted on its signature and Redis revocation
+        state alone. The database is only consulted once the token is past
+        half its lifetime, when it is rotated for a new one.
+        """
         try:
             payload = jwt.decode(refresh_token, self.secret_key, algorithms=[self.algorithm])
             token_type = payload.get("type")
@@ -146,6 +203,32 @@ class AuthService:
                 raise AuthenticationError("Invalid token type")
 
             user_id = payload.get("sub")
+            jti = payload.get("jti")
+            issued_at = payload.get("iat")
+            if user_id is None or jti is None or issued_at is None:
+                raise AuthenticationError("Invalid refresh token")
+
+            revoked = await token_cache.is_refresh_token_revoked(jti, user_id, issued_at)
+            if revoked:
+                raise AuthenticationError("Refresh token has been revoked")
+
+            rotate_at = issued_at + self.refresh_token_expire_minutes * 60 // 2
+            if revoked is not None and time.time() < rotate_at:
+                # Fast path: reissue the access token from the refresh claims
+                token_data = {
+                    "sub": user_id,
+                    "tenant_id": payload.get("tenant_id"),
+                    "email": payload.get("email"),
+                    "role": payload.get("role")
+                }
+
+                return Token(
+                    access_token=self.create_access_token(token_data),
+                    refresh_token=refresh_token,
+                    token_type="bearer",
+                    expires_in=self.access_token_expire_minutes * 60
+                )
+
             user = await self.get_user_by_id(db, user_id)
 
             if not user or not user.is_active:
@@ -163,6 +246,9 @@ class AuthService:
             access_token = self.create_access_token(token_data)
             new_refresh_token = self.create_refresh_token(token_data)
 
+            # The rotated-out token must not be usable again
+            await token_cache.revoke_refresh_token(jti, payload.get("exp"))
+
             return Token(
                 access_token=access_token,
                 refresh_token=new_refresh_token,
@@ -173,6 +259,12 @@ class AuthService:
         except JWTError:
             raise AuthenticationError("Could not validate refresh token")
 
+    async def revoke_refresh_tokens(self, user_id: str):
+        """Revoke all refresh tokens issued to a user so far."""
+        await token_cache.revoke_user_refresh_tokens(
+            user_id, self.refresh_token_expire_minutes * 60
+        )
+
     async def register_user(self, db: AsyncSession, user_data: UserCreate) -> User:
         """Register a new user and tenant."""
         # Check if user already exists
@@ -184,10 +276,8 @@ class AuthService:
         tenant_slug = user_data.firm_name.lower().replace(" ", "-").replace("_", "-")
 
         # Ensure unique slug
-        slug_query = select(Tenant).where(Tenant.slug == tenant_slug)
-        existing_tenant = await db.execute(slug_query)
-        if existing_tenant.scalar_one_or_none():
-            import uuid
+        slug_taken = await db.scalar(select(exists().where(Tenant.slug == tenant_slug)))
+        if slug_taken:
             tenant_slug = f"{tenant_slug}-{str(uuid.uuid4())[:8]}"
 
         tenant = Tenant(
@@ -215,7 +305,6 @@ class AuthService:
         db.add(user)
 
         await db.commit()
-        await db.refresh(user)
 
         # TODO: Send verification email
 
@@ -223,10 +312,21 @@ class AuthService:
 
     async def get_current_user(
         self,
+        request: Request,
         token: str = Depends(oauth2_scheme),
         db: AsyncSession = Depends(get_db)
     ) -> User:
-        """Get current authenticated user."""
+        """
+        Get current authenticated user.
+
+        The user is resolved once per request and kept on ``request.state``.
+        A token cache hit skips JWT verification: entries are only written
+        for verified tokens and expire no later than the token itself.
+        """
+        user = getattr(request.state, "user", None)
+        if user is not None:
+            return user
+
         credentials_exception = HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
@@ -234,6 +334,14 @@ class AuthService:
         )
 
         try:
+            token_hash = token_cache.hash_token(token)
+
+            cached_user = await token_cache.get_token(token_hash)
+            if cached_user is not None:
+                user = await db.merge(self._user_from_cache(cached_user), load=False)
+                request.state.user = user
+                return user
+
             token_data = self.verify_token(token)
             user = await self.get_user_by_id(db, token_data.sub)
 
@@ -246,18 +354,27 @@ class AuthService:
                     detail="Inactive user"
                 )
 
+            await token_cache.set_token(
+                token_hash, str(user.id), self._user_to_cache(user), token_data.exp
+            )
+
+            request.state.user = user
             return user
 
         except AuthenticationError:
             raise credentials_exception
 
-    async def logout_user(self, db: AsyncSession, user_id: str):
+    async def logout_user(self, db: AsyncSession, user_id: str, token: Optional[str] = None):
         """Logout user (in production, this would invalidate tokens)."""
         # In a production system, you might want to:
         # 1. Add tokens to a blacklist
         # 2. Store active sessions in Redis
         # 3. Implement token revocation
 
+        # Stop serving this token from the cache
+        if token:
+            await token_cache.invalidate(token_cache.hash_token(token))
+
         # For now, just update last seen time
         user = await self.get_user_by_id(db, user_id)
         if user:
@@ -303,6 +420,10 @@ class AuthService:
 
         await db.commit()
 
+        # Force every outstanding token back through the database
+        await token_cache.invalidate_user(str(user.id))
+        await self.revoke_refresh_tokens(str(user.id))
+
     async def verify_email(self, db: AsyncSession, token: str):
         """Verify email address using verification token."""
         query = select(User).where(User.verification_token == token)
@@ -3,19 +3,112 @@ File storage service for handling media uploads and file management.
 """
 
 import os
+import ssl
+import asyncio
+import mmap
 import shutil
 import hashlib
+import logging
+import functools
 from typing import BinaryIO, Optional, List
 from pathlib import Path
 from datetime import datetime
 
 from app.core.config import settings
+from app.core.exceptions import FileSizeExceededError
+
+
+logger = logging.getLogger(__name__)
+
+MMAP_HASH_THRESHOLD = 10 * 1024 * 1024  # 10 MB
+MMAP_HASH_WINDOW = 256 * 1024 * 1024  # 256 MB
+MMAP_HASH_WINDOWED_ABOVE = 1024 * 1024 * 1024  # 1 GiB
+PROBE_HASH_BYTES = 64 * 1024  # 64 KiB from each end
+FILEOBJ_READ_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+S3_PART_SIZE = 8 * 1024 * 1024  # 8 MiB; S3 requires >= 5 MiB for all but the last part
+S3_UPLOAD_CONCURRENCY = 4  # parts in flight per upload
+
+
+@functools.cache
+def log_hash_backend():
+    """
+    Log which SHA-256 implementation upload hashing runs on, once per process.
+
+    OpenSSL 1.1.1+ picks SHA extensions (SHA-NI) at runtime via CPUID, so a
+    stock python:3.11-slim or Ubuntu 22.04 image (OpenSSL 3.0) needs no
+    special build; an older OpenSSL falls back to scalar SHA-256.
+    """
+    logger.info(
+        f"Upload hashing uses {hashlib.new('sha256').name} from {ssl.OPENSSL_VERSION}"
+    )
+    if ssl.OPENSSL_VERSION_INFO < (1, 1, 1):
+        logger.warning("OpenSSL older than 1.1.1; SHA-256 will not use CPU SHA extensions")
+
+
+def hash_file_fast(path) -> str:
+    """
+    SHA-256 a file on disk.
+
+    Large files are hashed straight from a read-only mmap so the page cache
+    feeds OpenSSL without Python-side buffer copies; files over 1 GiB are
+    mapped in windows to bound address-space use. Smaller files go through
+    hashlib.file_digest.
+    """
+    size = os.path.getsize(path)
+
+    with open(path, "rb") as f:
+        if size < MMAP_HASH_THRESHOLD:
+            # Read/update loop runs in C with the GIL released (Python 3.11+)
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+        hasher = hashlib.sha256()
+        if size <= MMAP_HASH_WINDOWED_ABOVE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hasher.update(mm)
+        else:
+            # Window offsets are multiples of 256 MB, so always page aligned
+            for offset in range(0, size, MMAP_HASH_WINDOW):
+                length = min(MMAP_HASH_WINDOW, size - offset)
+                with mmap.mmap(f.fileno(), length, access=mmap.ACCESS_READ, offset=offset) as mm:
+                    hasher.update(mm)
+
+    return hasher.hexdigest()
+
+
+def hash_file_probe(fileobj: BinaryIO, size: int) -> str:
+    """
+    Cheap fingerprint of a seekable file: SHA-256 over the first and last
+    64 KiB plus the size, truncated to 32 hex chars.
+
+    Equal probes only mark a duplicate candidate; confirm with a full hash.
+    Leaves the file positioned at the start.
+    """
+    fileobj.seek(0)
+    head = fileobj.read(PROBE_HASH_BYTES)
+    tail = b""
+    if size > PROBE_HASH_BYTES:
+        fileobj.seek(-PROBE_HASH_BYTES, os.SEEK_END)
+        tail = fileobj.read(PROBE_HASH_BYTES)
+    fileobj.seek(0)
+
+    return hashlib.sha256(head + tail + size.to_bytes(8, "little")).hexdigest()[:32]
+
+
+def hash_fileobj(fileobj: BinaryIO) -> str:
+    """SHA-256 a seekable file object from the start, then rewind it."""
+    fileobj.seek(0)
+    hasher = hashlib.sha256()
+    for chunk in iter(lambda: fileobj.read(FILEOBJ_READ_CHUNK_SIZE), b""):
+        hasher.update(chunk)
+    fileobj.seek(0)
+    return hasher.hexdigest()
 
 
 class StorageService:
     """Service for handling file storage operations."""
     
     def __init__(self):
+        log_hash_backend()
         self.storage_root = Path(settings.STORAGE_ROOT)
         self.storage_root.mkdir(exist_ok=True, parents=True)
         
@@ -73,11 +166,8 @@ class StorageService:
         
         # Search for files with matching hash
         for file_path in tenant_path.rglob("*"):
-            if file_path.is_file():
-                with open(file_path, "rb") as f:
-                    file_hash = self.generate_file_hash(f.read())
-                    if file_hash == content_hash:
-                        return file_path
+            if file_path.is_file() and await asyncio.to_thread(hash_file_fast, file_path) == content_hash:
+                return file_path
         
         return None
     
@@ -177,19 +267,118 @@ class S3StorageService(StorageService):
     """S3-compatible storage service (for production)."""
     
     def __init__(self):
-        # This would use boto3 for S3 operations
-        # For now, fall back to local storage
         super().__init__()
         
-        # In production, initialize S3 client:
-        # import boto3
-        # self.s3_client = boto3.client(
-        #     's3',
-        #     aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        #     aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        #     region_name=settings.AWS_REGION
-        # )
-        # self.bucket_name = settings.S3_BUCKET_NAME
+        # Without a bucket configured, fall back to local storage
+        self.s3_client = None
+        self.bucket_name = settings.S3_BUCKET
+        if self.bucket_name:
+            import boto3
+            self.s3_client = boto3.client(
+                "s3",
+                endpoint_url=settings.S3_ENDPOINT,
+                aws_access_key_id=settings.S3_ACCESS_KEY,
+                aws_secret_access_key=settings.S3_SECRET_KEY,
+                region_name=settings.S3_REGION,
+                use_ssl=settings.S3_USE_SSL,
+            )
+    
+    async def upload_stream(
+        self,
+        fileobj,
+        key: str,
+        content_type: str,
+        filename: str,
+        max_size: int
+    ) -> tuple[int, str]:
+        """
+        Stream an upload into S3 as a multipart upload, hashing as it goes.
+        
+        Each part is read, folded into the SHA-256 and handed to S3 while the
+        next part is read, so at most S3_UPLOAD_CONCURRENCY parts are held in
+        memory and nothing touches local disk.
+        
+        Returns:
+            tuple: (file_size, content_hash)
+        """
+        client = self.s3_client
+        multipart = await asyncio.to_thread(
+            client.create_multipart_upload,
+            Bucket=self.bucket_name, Key=key, ContentType=content_type
+        )
+        upload_id = multipart["UploadId"]
+        hasher = hashlib.sha256()
+        slots = asyncio.Semaphore(S3_UPLOAD_CONCURRENCY)
+        pending = []
+        file_size = 0
+        
+        async def upload_part(part_number: int, body: bytes) -> dict:
+            try:
+                response = await asyncio.to_thread(
+                    client.upload_part,
+                    Bucket=self.bucket_name, Key=key, UploadId=upload_id,
+                    PartNumber=part_number, Body=body
+                )
+            finally:
+                slots.release()
+            return {"ETag": response["ETag"], "PartNumber": part_number}
+        
+        try:
+            part_number = 1
+            while chunk := await fileobj.read(S3_PART_SIZE):
+                file_size += len(chunk)
+                if file_size > max_size:
+                    raise FileSizeExceededError(filename, file_size, max_size)
+                await asyncio.to_thread(hasher.update, chunk)
+                await slots.acquire()
+                pending.append(asyncio.create_task(upload_part(part_number, chunk)))
+                part_number += 1
+            
+            parts = await asyncio.gather(*pending)
+            if parts:
+                await asyncio.to_thread(
+                    client.complete_multipart_upload,
+                    Bucket=self.bucket_name, Key=key, UploadId=upload_id,
+                    MultipartUpload={"Parts": parts}
+                )
+        except BaseException:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            await asyncio.to_thread(
+                client.abort_multipart_upload,
+                Bucket=self.bucket_name, Key=key, UploadId=upload_id
+            )
+            raise
+        
+        if not parts:
+            # Multipart uploads need at least one part; store empty files directly
+            await asyncio.to_thread(
+                client.abort_multipart_upload,
+                Bucket=self.bucket_name, Key=key, UploadId=upload_id
+            )
+            await asyncio.to_thread(
+                client.put_object,
+                Bucket=self.bucket_name, Key=key, Body=b"", ContentType=content_type
+            )
+        
+        return file_size, hasher.hexdigest()
+    
+    async def delete_object(self, key: str):
+        """Delete an object from the bucket."""
+        await asyncio.to_thread(self.s3_client.delete_object, Bucket=self.bucket_name, Key=key)
+    
+    def presigned_download_url(self, key: str, filename: str, expires_in: int = 300) -> str:
+        """Generate a short-lived GET URL so downloads bypass the API."""
+        return self.s3_client.generate_presigned_url(
+            "get_object",
+            Params={
+                "Bucket": self.bucket_name,
+                "Key": key,
+                "ResponseContentDisposition": f'attachment; filename="{filename}"',
+            },
+            ExpiresIn=expires_in,
+        )
     
     async def store_file(self, file_content: bytes, tenant_id: str, matter_id: str, original_filename: str) -> tuple[str, str]:
         """Store file in S3."""
@@ -211,8 +400,14 @@ class S3StorageService(StorageService):
         return await super().store_file(file_content, tenant_id, matter_id, original_filename)
 
 
+@functools.cache
 def get_storage_service() -> StorageService:
-    """Get the appropriate storage service based on configuration."""
+    """
+    Get the appropriate storage service based on configuration.
+
+    Built once per process so the boto3 client and its connection pool are
+    reused across requests and tasks instead of being recreated per call.
+    """
     if settings.STORAGE_BACKEND == "s3":
         return S3StorageService()
     else:
@@ -0,0 +1,18 @@
+"""
+Database engine and session factory shared by the Celery task modules.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+
+
+# Each task runs in its own asyncio.run() loop, so pooled connections
+# must not outlive it
+async_engine = create_async_engine(str(settings.DATABASE_URL), poolclass=NullPool)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    expire_on_commit=False
+)
@@ -5,29 +5,36 @@ Background tasks for generating and exporting various file formats.
 import os
 import tempfile
 import asyncio
-from typing import Dict, Any, List
+from typing import Dict, Any, List, AsyncIterable, AsyncIterator, BinaryIO, Iterable
 from datetime import datetime
 from pathlib import Path
+import orjson
 from celery import current_task
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import select
+from sqlalchemy import select, update, case, literal
+from sqlalchemy.dialects.postgresql import JSONB
 
 from app.tasks.celery_app import celery_app
-from app.core.config import settings
+from app.tasks.db import AsyncSessionLocal
+from app.models.export import Export, ExportStatus, ExportType
 from app.models.transcript import Transcript, TranscriptSegment
 from app.models.matter import Matter
 from app.models.user import User, Tenant
 from app.services.storage_service import get_storage_service
 
 
-# Create async database session for tasks
-async_engine = create_async_engine(str(settings.DATABASE_URL))
-AsyncSessionLocal = sessionmaker(
-    async_engine, 
-    class_=AsyncSession, 
-    expire_on_commit=False
-)
+# Rows fetched per round-trip when streaming segments for large exports
+SEGMENT_STREAM_BATCH_SIZE = 500
+
+
+def _mark_exported_stmt(transcript_id, format: str):
+    """Record an export on a transcript in one UPDATE, without reading it first."""
+    return update(Transcript).where(Transcript.id == transcript_id).values(
+        exported_formats=case(
+            (Transcript.exported_formats.contains([format]), Transcript.exported_formats),
+            else_=Transcript.exported_formats.op("||")(literal([format], JSONB)),
+        ),
+        last_exported_at=datetime.utcnow().isoformat(),
+    )
 
 
 class ExportService:
@@ -74,38 +81,55 @@ class ExportService:
         
         return "\n".join(lines)
     
-    def generate_json_format(self, transcript: Transcript, segments: List[TranscriptSegment]) -> Dict[str, Any]:
-        """Generate JSON format."""
+    def _transcript_json(self, transcript: Transcript) -> Dict[str, Any]:
+        return {
+            "id": str(transcript.id),
+            "title": transcript.title,
+            "language": transcript.language,
+            "duration_seconds": transcript.duration_seconds,
+            "word_count": transcript.word_count,
+            "speaker_count": transcript.speaker_count,
+            "created_at": transcript.created_at.isoformat(),
+            "confidence_score": float(transcript.confidence_score) if transcript.confidence_score else None
+        }
+    
+    def _segment_json(self, segment: TranscriptSegment) -> Dict[str, Any]:
         return {
-            "transcript": {
-                "id": str(transcript.id),
-                "title": transcript.title,
-                "language": transcript.language,
-                "duration_seconds": transcript.duration_seconds,
-                "word_count": transcript.word_count,
-                "speaker_count": transcript.speaker_count,
-                "created_at": transcript.created_at.isoformat(),
-                "confidence_score": float(transcript.confidence_score) if transcript.confidence_score else None
-            },
-            "segments": [
-                {
-                    "index": segment.segment_index,
-                    "start_time": segment.start_time,
-                    "end_time": segment.end_time,
-                    "duration": segment.duration,
-                    "text": segment.text,
-                    "speaker": {
-                        "id": segment.speaker_id,
-                        "name": segment.speaker_name,
-                        "role": segment.speaker_role.value if segment.speaker_role else None
-                    } if segment.has_speaker else None,
-                    "confidence": float(segment.confidence) if segment.confidence else None,
-                    "word_count": segment.word_count
-                }
-                for segment in segments
-            ]
+            "index": segment.segment_index,
+            "start_time": segment.start_time,
+            "end_time": segment.end_time,
+            "duration": segment.duration,
+            "text": segment.text,
+            "speaker": {
+                "id": segment.speaker_id,
+                "name": segment.speaker_name,
+                "role": segment.speaker_role.value if segment.speaker_role else None
+            } if segment.has_speaker else None,
+            "confidence": float(segment.confidence) if segment.confidence else None,
+            "word_count": segment.word_count
         }
     
+    async def write_json_stream(
+        self,
+        transcript: Transcript,
+        segments: AsyncIterable[TranscriptSegment],
+        out: BinaryIO
+    ) -> int:
+        """
+        Write JSON format to ``out`` and return the number of bytes written.
+        
+        Each segment is encoded and written as it arrives, so memory stays
+        at one segment however long the transcript is.
+        """
+        header = orjson.dumps({"transcript": self._transcript_json(transcript)})
+        written = out.write(header[:-1] + b',"segments":[')
+        separator = b""
+        async for segment in segments:
+            written += out.write(separator + orjson.dumps(self._segment_json(segment)))
+            separator = b","
+        written += out.write(b"]}")
+        return written
+    
     async def generate_pdf(self, transcript: Transcript, segments: List[TranscriptSegment]) -> bytes:
         """Generate PDF format using reportlab."""
         try:
@@ -251,13 +275,15 @@ async def _export_transcript_async(task, transcript_id: str, format: str, option
             if not transcript:
                 raise Exception(f"Transcript {transcript_id} not found")
             
-            # Get segments
+            # Get segments; JSON streams them below instead of loading all
             segments_query = select(TranscriptSegment).where(
                 TranscriptSegment.transcript_id == transcript_id
             ).order_by(TranscriptSegment.segment_index)
             
-            segments_result = await db.execute(segments_query)
-            segments = list(segments_result.scalars().all())
+            segments = []
+            if format != "json":
+                segments_result = await db.execute(segments_query)
+                segments = list(segments_result.scalars().all())
             
             task.update_state(
                 state="PROGRESS",
@@ -279,9 +305,7 @@ async def _export_transcript_async(task, transcript_id: str, format: str, option
                 file_extension = ".txt"
                 
             elif format == "json":
-                import json
-                export_data = export_service.generate_json_format(transcript, segments)
-                export_content = json.dumps(export_data, indent=2, ensure_ascii=False).encode('utf-8')
+                # Streamed straight into the export file below
                 content_type = "application/json"
                 file_extension = ".json"
                 
@@ -313,10 +337,16 @@ async def _export_transcript_async(task, transcript_id: str, format: str, option
             storage_path.parent.mkdir(parents=True, exist_ok=True)
             
             with open(storage_path, "wb") as f:
-                f.write(export_content)
+                if format == "json":
+                    segment_stream = await db.stream_scalars(
+                        segments_query.execution_options(yield_per=SEGMENT_STREAM_BATCH_SIZE)
+                    )
+                    file_size = await export_service.write_json_stream(transcript, segment_stream, f)
+                else:
+                    file_size = f.write(export_content)
             
             # Mark transcript as exported
-            transcript.mark_exported(format)
+            await db.execute(_mark_exported_stmt(transcript.id, format))
             await db.commit()
             
             task.update_state(
@@ -328,7 +358,7 @@ async def _export_transcript_async(task, transcript_id: str, format: str, option
                 "success": True,
                 "export_path": export_path,
                 "filename": filename,
-                "file_size": len(export_content),
+                "file_size": file_size,
                 "content_type": content_type,
                 "download_url": f"/api/v1/exports/download/{export_path}"
             }
@@ -381,6 +411,170 @@ async def _export_matter_summary_async(matter_id: str, format: str):
             raise e
 
 
+EXPORT_FILE_EXTENSIONS = {
+    "txt": ".txt",
+    "json": ".json",
+    "pdf": ".pdf",
+    "docx": ".docx",
+}
+
+
+@celery_app.task(name="app.tasks.export_tasks.process_exports")
+def process_exports(export_ids: List[str]):
+    """Generate files for a batch of export jobs."""
+    return asyncio.run(_process_exports_async(export_ids))
+
+
+async def _iter_segments(segments: Iterable[TranscriptSegment]) -> AsyncIterator[TranscriptSegment]:
+    """Adapt preloaded segments to the streaming JSON writer."""
+    for segment in segments:
+        yield segment
+
+
+async def _write_transcript_export(
+    transcript: Transcript,
+    segments: List[TranscriptSegment],
+    format: str,
+    options: Dict[str, Any],
+    out: BinaryIO
+) -> int:
+    """Render a transcript export in the requested format into ``out``."""
+    if format == "txt":
+        if options.get("include_timestamps", True):
+            content = export_service.generate_timestamped_text(transcript, segments)
+        else:
+            content = export_service.generate_plain_text(transcript, segments)
+        return out.write(content.encode("utf-8"))
+    
+    if format == "json":
+        # Same encoder as the single-export path, so files match
+        return await export_service.write_json_stream(transcript, _iter_segments(segments), out)
+    
+    if format == "pdf":
+        return out.write(await export_service.generate_pdf(transcript, segments))
+    
+    if format == "docx":
+        return out.write(await export_service.generate_docx(transcript, segments))
+    
+    raise Exception(f"Unsupported export format: {format}")
+
+
+async def _process_exports_async(export_ids: List[str]):
+    """
+    Process export jobs as one batch.
+
+    Exports, transcripts and segments are each loaded with a single IN
+    query, and all status changes are written back in one statement.
+    """
+    async with AsyncSessionLocal() as db:
+        exports_result = await db.execute(
+            select(Export).where(
+                Export.id.in_(export_ids),
+                Export.status == ExportStatus.PENDING
+            )
+        )
+        exports = list(exports_result.scalars().all())
+        
+        if not exports:
+            return {"processed": 0, "failed": 0}
+        
+        # IDs kept up front: the rows are expired after a rollback
+        batch_ids = [export.id for export in exports]
+        await db.execute(
+            update(Export)
+            .where(Export.id.in_(batch_ids))
+            .values(status=ExportStatus.PROCESSING)
+        )
+        await db.commit()
+        
+        # Rows stay PROCESSING until the final UPDATE below; if the batch
+        # dies before then, fail them rather than leave them stuck
+        try:
+            # Load every referenced transcript and its segments up front
+            transcript_ids = {
+                export.resource_id for export in exports
+                if export.export_type == ExportType.TRANSCRIPT
+            }
+            transcripts = {}
+            segments_by_transcript = {}
+            if transcript_ids:
+                transcripts_result = await db.execute(
+                    select(Transcript).where(Transcript.id.in_(transcript_ids))
+                )
+                transcripts = {str(t.id): t for t in transcripts_result.scalars()}
+            
+                segments_result = await db.execute(
+                    select(TranscriptSegment).where(
+                        TranscriptSegment.transcript_id.in_(transcript_ids)
+                    ).order_by(TranscriptSegment.transcript_id, TranscriptSegment.segment_index)
+                )
+                for segment in segments_result.scalars():
+                    segments_by_transcript.setdefault(str(segment.transcript_id), []).append(segment)
+        
+            updates = []
+            exported = []
+            for export in exports:
+                format = export.format.value
+                try:
+                    if export.export_type != ExportType.TRANSCRIPT:
+                        raise Exception(f"Export type {export.export_type.value} is not supported yet")
+                
+                    transcript = transcripts.get(export.resource_id)
+                    if not transcript:
+                        raise Exception(f"Transcript {export.resource_id} not found")
+                
+                    # Store in exports directory
+                    export_path = f"exports/{export.tenant_id}/{export.id}{EXPORT_FILE_EXTENSIONS[format]}"
+                    storage_path = export_service.storage_service.storage_root / export_path
+                    storage_path.parent.mkdir(parents=True, exist_ok=True)
+                
+                    with open(storage_path, "wb") as f:
+                        file_size = await _write_transcript_export(
+                            transcript,
+                            segments_by_transcript.get(export.resource_id, []),
+                            format,
+                            export.options or {},
+                            f
+                        )
+                
+                    exported.append((transcript.id, format))
+                    updates.append({
+                        "id": export.id,
+                        "status": ExportStatus.COMPLETED,
+                        "storage_path": export_path,
+                        "file_size": file_size,
+                        "completed_at": datetime.utcnow(),
+                    })
+                
+                except Exception as e:
+                    updates.append({
+                        "id": export.id,
+                        "status": ExportStatus.FAILED,
+                        "error_message": str(e),
+                    })
+        
+            # Bulk UPDATE by primary key for the whole batch
+            await db.execute(update(Export), updates)
+            for transcript_id, format in exported:
+                await db.execute(_mark_exported_stmt(transcript_id, format))
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            await db.execute(
+                update(Export)
+                .where(
+                    Export.id.in_(batch_ids),
+                    Export.status == ExportStatus.PROCESSING
+                )
+                .values(status=ExportStatus.FAILED, error_message=str(e))
+            )
+            await db.commit()
+            raise
+        
+        failed = sum(1 for u in updates if u["status"] == ExportStatus.FAILED)
+        return {"processed": len(updates) - failed, "failed": failed}
+
+
 @celery_app.task(name="app.tasks.export_tasks.cleanup_old_exports")
 def cleanup_old_exports(max_age_days: int = 7):
     """Clean up old export files."""
@@ -4,12 +4,10 @@ Maintenance and cleanup tasks for system health.
 
 import asyncio
 from datetime import datetime, timedelta
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
 from sqlalchemy import select, func, and_
 
 from app.tasks.celery_app import celery_app
-from app.core.config import settings
+from app.tasks.db import AsyncSessionLocal
 from app.models.user import User, Tenant
 from app.models.matter import Matter
 from app.models.media import MediaAsset, MediaStatus
@@ -17,15 +15,6 @@ from app.models.transcript import Transcript, TranscriptStatus
 from app.services.storage_service import get_storage_service
 
 
-# Create async database session for tasks
-async_engine = create_async_engine(str(settings.DATABASE_URL))
-AsyncSessionLocal = sessionmaker(
-    async_engine, 
-    class_=AsyncSession, 
-    expire_on_commit=False
-)
-
-
 @celery_app.task(name="app.tasks.maintenance_tasks.cleanup_temp_files")
 def cleanup_temp_files():
     """Clean up temporary files older than 24 hours."""
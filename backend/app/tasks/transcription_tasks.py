@@ -8,26 +8,16 @@ import asyncio
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 from celery import current_task
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
 
 from app.tasks.celery_app import celery_app
-from app.core.config import settings
+from app.tasks.db import AsyncSessionLocal
+from app.core import status_cache
 from app.models.media import MediaAsset, MediaStatus
 from app.models.transcript import Transcript, TranscriptSegment, TranscriptStatus, SpeakerRole
 from app.services.storage_service import get_storage_service
 from app.services.file_service import FileProcessingService
 
 
-# Create async database session for tasks
-async_engine = create_async_engine(str(settings.DATABASE_URL))
-AsyncSessionLocal = sessionmaker(
-    async_engine, 
-    class_=AsyncSession, 
-    expire_on_commit=False
-)
-
-
 async def get_db_session():
     """Get async database session."""
     async with AsyncSessionLocal() as session:
@@ -148,17 +138,18 @@ transcription_service = TranscriptionService()
 
 
 @celery_app.task(bind=True, name="app.tasks.transcription_tasks.transcribe_media")
-def transcribe_media(self, media_asset_id: str):
+def transcribe_media(self, media_asset_id: str, transcript_id: Optional[str] = None):
     """
     Transcribe a media asset.
     
     Args:
         media_asset_id: ID of the MediaAsset to transcribe
+        transcript_id: Existing Transcript to fill in; a new one is created if omitted
     """
-    return asyncio.run(_transcribe_media_async(self, media_asset_id))
+    return asyncio.run(_transcribe_media_async(self, media_asset_id, transcript_id))
 
 
-async def _transcribe_media_async(task, media_asset_id: str):
+async def _transcribe_media_async(task, media_asset_id: str, transcript_id: Optional[str] = None):
     """Async implementation of media transcription."""
     async with AsyncSessionLocal() as db:
         try:
@@ -169,7 +160,7 @@ async def _transcribe_media_async(task, media_asset_id: str):
             )
             
             # Get media asset
-            from sqlalchemy import select
+            from sqlalchemy import select, delete
             query = select(MediaAsset).where(MediaAsset.id == media_asset_id)
             result = await db.execute(query)
             media_asset = result.scalar_one_or_none()
@@ -250,23 +241,33 @@ async def _transcribe_media_async(task, media_asset_id: str):
                     meta={"stage": "processing_segments", "progress": 60}
                 )
                 
-                # Create transcript record
-                transcript = Transcript(
-                    tenant_id=media_asset.tenant_id,
-                    matter_id=media_asset.matter_id,
-                    media_asset_id=media_asset.id,
-                    title=f"Transcript - {media_asset.original_filename}",
-                    content=transcription_result["text"],
-                    status=TranscriptStatus.COMPLETED,
-                    language=transcription_result["language"],
-                    model_used="whisper-large-v3",
-                    speaker_diarization_enabled=media_asset.speaker_diarization,
-                    confidence_score=0.85,  # Mock confidence score
-                    created_by_user_id=media_asset.created_by_user_id,
-                    updated_by_user_id=media_asset.created_by_user_id
-                )
+                # Fill in the requested transcript, or create one for the media
+                transcript = await db.get(Transcript, transcript_id) if transcript_id else None
+                created = transcript is None
+                if created:
+                    transcript = Transcript(
+                        tenant_id=media_asset.tenant_id,
+                        matter_id=media_asset.matter_id,
+                        media_asset_id=media_asset.id,
+                        title=f"Transcript - {media_asset.original_filename}",
+                        created_by_user_id=media_asset.created_by_user_id,
+                        updated_by_user_id=media_asset.created_by_user_id
+                    )
+                    db.add(transcript)
+                else:
+                    # A re-run or Celery retry replaces earlier segments
+                    # rather than appending a second set
+                    await db.execute(
+                        delete(TranscriptSegment).where(TranscriptSegment.transcript_id == transcript.id)
+                    )
+                
+                transcript.content = transcription_result["text"]
+                transcript.status = TranscriptStatus.COMPLETED
+                transcript.language = transcription_result["language"]
+                transcript.model_used = "whisper-large-v3"
+                transcript.speaker_diarization_enabled = media_asset.speaker_diarization
+                transcript.confidence_score = 0.85  # Mock confidence score
                 
-                db.add(transcript)
                 await db.flush()  # Get transcript ID
                 
                 # Process segments with speaker assignment
@@ -311,20 +312,23 @@ async def _transcribe_media_async(task, media_asset_id: str):
                 # Update media asset status
                 media_asset.set_processing_status(MediaStatus.TRANSCRIBED)
                 
-                # Update matter statistics
-                from app.models.matter import Matter
-                matter_query = select(Matter).where(Matter.id == media_asset.matter_id)
-                matter_result = await db.execute(matter_query)
-                matter = matter_result.scalar_one_or_none()
-                
-                if matter:
-                    matter.update_statistics(
-                        transcript_count_delta=1,
-                        duration_delta=int(media_asset.duration_ms or 0),
-                        storage_delta=media_asset.file_size
-                    )
+                # Update matter statistics, once per transcript: re-running an
+                # existing transcript must not count it again
+                if created:
+                    from app.models.matter import Matter
+                    matter_query = select(Matter).where(Matter.id == media_asset.matter_id)
+                    matter_result = await db.execute(matter_query)
+                    matter = matter_result.scalar_one_or_none()
+                    
+                    if matter:
+                        matter.update_statistics(
+                            transcript_count_delta=1,
+                            duration_delta=int(media_asset.duration_ms or 0),
+                            storage_delta=media_asset.file_size
+                        )
                 
                 await db.commit()
+                status_cache.invalidate_sync(str(media_asset.tenant_id), str(transcript.id))
                 
                 # Final progress update
                 task.update_state(
@@ -348,10 +352,22 @@ async def _transcribe_media_async(task, media_asset_id: str):
                     os.unlink(wav_path)
                 
         except Exception as e:
+            # Discard whatever the failed step left pending before recording the failure
+            await db.rollback()
+            
             # Update media asset status to failed
             if 'media_asset' in locals():
                 media_asset.set_processing_status(MediaStatus.FAILED, str(e))
-                await db.commit()
+            
+            # start_transcription marked the transcript PROCESSING; don't
+            # leave pollers waiting on it forever
+            failed_transcript = await db.get(Transcript, transcript_id) if transcript_id else None
+            if failed_transcript is not None:
+                failed_transcript.set_processing_status(TranscriptStatus.FAILED, str(e))
+            
+            await db.commit()
+            if failed_transcript is not None:
+                status_cache.invalidate_sync(str(failed_transcript.tenant_id), transcript_id)
             
             raise e
 
@@ -2,6 +2,12 @@
 Database initialization script for CasePrep.
 
 This script creates the database tables and initial data.
+
+The schema is built from the models with create_all, which already
+includes every migration in alembic/versions, so the database is then
+stamped at the Alembic head. Later schema changes are applied to it with
+``alembic upgrade head``; the migration chain has no baseline revision
+and is not meant to build an empty database on its own.
 """
 
 import asyncio
@@ -11,6 +17,9 @@ import os
 # Add the parent directory to the path so we can import our app
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 
@@ -33,12 +42,19 @@ async def create_tables():
             print("Dropping existing tables...")
             await conn.run_sync(BaseModel.metadata.drop_all)
             
+            # Trigram indexes (matter search) need pg_trgm
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            
             # Create all tables
             print("Creating tables...")
             await conn.run_sync(BaseModel.metadata.create_all)
             
         print("✅ Database tables created successfully!")
         
+        # Record the schema as current so `alembic upgrade head` doesn't try
+        # to re-create what create_all just built
+        await asyncio.to_thread(stamp_head)
+        
     except Exception as e:
         print(f"❌ Error creating tables: {e}")
         raise
@@ -46,6 +62,17 @@ async def create_tables():
         await engine.dispose()
 
 
+def stamp_head():
+    """Mark the database as up to date with the latest migration."""
+    # env.py runs its own event loop, hence a worker thread
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    alembic_cfg = Config(os.path.join(backend_dir, "alembic.ini"))
+    # script_location in alembic.ini is relative to the working directory
+    alembic_cfg.set_main_option("script_location", os.path.join(backend_dir, "alembic"))
+    command.stamp(alembic_cfg, "head", purge=True)
+    print("✅ Database stamped at Alembic head")
+
+
 async def create_sample_data():
     """Create sample data for development."""
     engine = create_async_engine(str(settings.DATABASE_URL))
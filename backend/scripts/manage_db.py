@@ -2,7 +2,7 @@
 Database management script for CasePrep.
 
 Usage:
-    python scripts/manage_db.py init    # Initialize database with tables
+    python scripts/manage_db.py init    # Initialize database with tables (stamped at Alembic head)
     python scripts/manage_db.py reset   # Reset database (drop and recreate)
     python scripts/manage_db.py sample  # Add sample data
 """
@@ -40,7 +40,8 @@ Usage:
     python scripts/manage_db.py <command>
 
 Commands:
-    init    - Initialize database with tables
+    init    - Initialize database with tables and stamp it at the Alembic
+              head; apply later migrations with `alembic upgrade head`
     reset   - Reset database (drop and recreate all tables)
     sample  - Add sample data for development
     help    - Show this help message